@@ -1,5 +1,6 @@
 configs = {
-    'encoding': 'UTF-8-SIG'
+    'encoding': 'UTF-8-SIG',
+    'read_buffer_size': 131072
 }
 
 from nuix_nli_lib.data_types.csv_file import CSVEntry, CSVRowEntry
@@ -77,7 +77,11 @@ class CSVEntry(FileEntry):
         if not self.file_path.is_file():
             raise IOError(f'File does not exist or is not a file: {self.file_path}')
 
-        with self.file_path.open(mode='r', encoding=data_types.configs['encoding']) as file:
+        # newline='' leaves line endings to the csv module, as it requires, so it can handle newlines in quoted values
+        with self.file_path.open(mode='r',
+                                 buffering=data_types.configs['read_buffer_size'],
+                                 encoding=data_types.configs['encoding'],
+                                 newline='') as file:
             reader: csv.DictReader = csv.DictReader(file, delimiter=delimiter)
             self.__row_fields = [f for f in list(reader.fieldnames) if len(f.strip()) > 0]
             for row in reader:
@@ -112,29 +116,24 @@ class CSVEntry(FileEntry):
         """
         row_gen = self.__row_generator or CSVRowEntry
         builder.add_entry(self)
-        for index in range(len(self.data)):
-            builder.add_entry(row_gen(self, index))
+        builder.add_entries(row_gen(self, index) for index in range(len(self.data)))
 
-        return self[self.identifier_field].value
+        return self.identifier
 
 
 class CSVRowEntry(MappingEntry):
     def __init__(self, parent_csv: CSVEntry, row_index: int, parent_id: str = None):
         self.__parent_csv: CSVEntry = parent_csv
-        self.__row_index: int = row_index
 
-        super().__init__({},
+        # The row's dictionary is the entry's mapping, so reading the data does not go back through the CSVEntry
+        super().__init__(parent_csv.data[row_index],
                          "application/x-database-table-row",
-                         parent_id=parent_id or parent_csv[parent_csv.identifier_field].value)
+                         parent_id=parent_id or parent_csv.identifier)
 
     @property
     def fields(self) -> list[str]:
         return [f for f in self.__parent_csv.row_fields if len(f.strip()) > 0]
 
-    @property
-    def data(self) -> dict[str, Any]:
-        return self.__parent_csv.data[self.__row_index]
-
     @property
     def parent_csv(self) -> CSVEntry:
         return self.__parent_csv
@@ -199,7 +199,7 @@ class JSONFileEntry(FileEntry):
                 _contents[key] = val_value['Value'].value
 
         object_entry = self.__object_value_generator(name, _contents, parent_id=parent_id)
-        object_id = object_entry[object_entry.identifier_field].value
+        object_id = object_entry.identifier
 
         for key, value in _objects.items():
             self.__add_object(builder, key, value, parent_id=object_id)
@@ -223,7 +223,7 @@ class JSONFileEntry(FileEntry):
                 _contents[str(idx)] = itm_value['Value'].value
 
         array_entry = self.__array_value_generator(name, _contents, parent_id=parent_id)
-        array_id = array_entry[array_entry.identifier_field].value
+        array_id = array_entry.identifier
 
         for obj_name, obj in _objects.items():
             self.__add_object(builder, obj_name, obj, parent_id=array_id)
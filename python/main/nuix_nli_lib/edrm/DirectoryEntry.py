@@ -56,7 +56,7 @@ class DirectoryEntry(FileEntry):
     def directory(self) -> Path:
         return self.__directory
 
-    def add_file(self, document, container, entry_map: dict[str, object], for_nli: bool) -> None:
+    def add_file(self, writer, entry_map: dict[str, object], for_nli: bool) -> None:
         # No Native for a directory
         return
 
@@ -1,10 +1,13 @@
+import hashlib
+import io
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, TextIO
 from copy import deepcopy
 
-from xml.dom.minidom import getDOMImplementation, Element, Document
+from xml.dom.minidom import parseString, Document
 
-from nuix_nli_lib.edrm import DirectoryEntry, EntryInterface, FileEntry, MappingEntry
+from nuix_nli_lib.edrm import DirectoryEntry, EntryInterface, FileEntry, MappingEntry, EDRMWriter, FieldRegistry
+from nuix_nli_lib.edrm import EDRMUtilities as eutes
 from nuix_nli_lib import edrm, debug_log
 
 
@@ -115,19 +118,32 @@ class EDRMBuilder:
         :return: The unique (within the load file) id for the added Entry.  Note, this ID must be produced by the
                  passed-in EntryInterface instance, it is not generated by this method.
         """
-        entry_id = entry[entry.identifier_field].value
-        self.__entries[entry_id] = entry
-        parent_id = entry.parent
+        return self.add_entries((entry,))[0]
 
-        if entry_id not in self.__families.keys():
-            self.__families[entry_id] = []
+    def add_entries(self, entries: Iterable[EntryInterface]) -> list[str]:
+        """
+        Add several implementations of the EntryInterface class to the EDRM load file, as `add_entry` does for one.
+        This is cheaper than calling `add_entry` for each entry when a source produces many entries at once, such as
+        the rows of a CSV file.
+        :param entries: The entries to add to the EDRM load file, in order.  Parents should come before their children.
+        :return: The unique (within the load file) ids for the added Entries, in the order they were added.
+        """
+        entry_map = self.__entries
+        families = self.__families
+        entry_ids = []
+
+        for entry in entries:
+            entry_id = entry.identifier
+            entry_map[entry_id] = entry
+            families.setdefault(entry_id, [])
 
-        if parent_id is not None:
-            family = self.__families.get(parent_id, [])
-            family.append(entry_id)
-            self.__families[parent_id] = family
+            parent_id = entry.parent
+            if parent_id is not None:
+                families.setdefault(parent_id, []).append(entry_id)
 
-        return entry_id
+            entry_ids.append(entry_id)
+
+        return entry_ids
 
     def add_file(self, file_path: str, mimetype: str, parent_id: str = None) -> str:
         """
@@ -171,15 +187,49 @@ class EDRMBuilder:
         """
         return self.add_entry(MappingEntry(mapping, mimetype, parent_id))
 
-    def __add_folder(self, doc_id: str, document: Document, container: Element, families):
+    def state_signature(self) -> bytes:
         """
-        Internal method that recursively adds Folder elements to the XML document.
+        Calculate a signature for everything the load file is built from: the `as_nli` flag, the edrm configs, each
+        entry's id, parent, and field values, the text of mapping entries, the size and modification time of each
+        file entry's native (whose MD5 is calculated when the load file is written), and the family structure.  This
+        is much cheaper than writing the load file, and if the signature has not changed between two saves then the
+        load file will not have changed either, so it can be reused.
+
+        The signature is a SHA-1 digest of the state, fed to the hash one piece at a time, so no copy of the state is
+        kept.  Custom entry types which write content to the load file that is not held in their fields should not rely
+        on this signature.
+        :return: The SHA-1 digest of the builder's current state
+        """
+        signature = hashlib.sha1()
+
+        def add_to_signature(part: Any) -> None:
+            # repr() escapes any line breaks inside the part, so each part is kept distinct by the one that ends it
+            signature.update(f'{part!r}\n'.encode())
+
+        add_to_signature(self.__as_nli)
+        add_to_signature(tuple(edrm.configs.items()))
+        for entry_id, entry in self.__entries.items():
+            add_to_signature((entry_id, entry.parent))
+            for _, field in entry:
+                add_to_signature((field.name, field.data_type, eutes.format_field_value(field.value)))
+
+            if isinstance(entry, MappingEntry):
+                add_to_signature(entry.text)
+            elif isinstance(entry, FileEntry) and not isinstance(entry, DirectoryEntry):
+                native_stat = entry.file_path.stat()
+                add_to_signature((native_stat.st_size, native_stat.st_mtime_ns))
+
+        for parent_id, family in self.__families.items():
+            add_to_signature((parent_id, tuple(family)))
+        return signature.digest()
+
+    def __write_folder(self, doc_id: str, writer: EDRMWriter, families):
+        """
+        Internal method that recursively writes Folder elements to the load file.
         """
         if self.__entries.get(doc_id).parent is not None:
             # If this isn't a top level item, add it as a document
-            doc_element = document.createElement('Document')
-            doc_element.setAttribute('DocId', doc_id)
-            container.appendChild(doc_element)
+            writer.empty_element('Document', {'DocId': doc_id})
 
         if doc_id not in families:
             # If this is not the top of a family, no need to continue
@@ -188,75 +238,97 @@ class EDRMBuilder:
         family = families.pop(doc_id)
         if len(family) > 0:
             # Add this document's family as contained documents and folders
-            folder_element = document.createElement('Folder')
-            folder_element.setAttribute('FolderName', doc_id)
-            container.appendChild(folder_element)
-
+            writer.start_element('Folder', {'FolderName': doc_id})
             for child in self.__families[doc_id]:
-                self.__add_folder(child, document, folder_element, families)
+                self.__write_folder(child, writer, families)
+            writer.end_element()
 
-    def build(self) -> Document:
+    def __write(self, load_file: TextIO, addindent: str, newl: str, declaration: bool = True) -> None:
         """
-        Create the EDRM load file document, but do not save it to disk.  Call this method only after setting the
-        `as_nli` flag and adding all desired entries.  This is useful when the target location for saving the load file
-        is not to disk, or if there is additional customization of the load file needed.  This file will be called from
-        the `save()` method, so if the target is to save the file to disk without customization, there is no need to
-        call this method explicitly.
+        Internal method that serializes the load file, writing it to `load_file` as it goes rather than building the
+        whole document in memory first.  Each entry writes itself to the load file through an EDRMWriter.
 
-        :return: Document containing the serialized load file contents.
+        The Keys for the fields are assigned by a FieldRegistry owned by this build, in the order the fields are first
+        seen, so they do not depend on any other entries or builds that have been created.
         """
-        impl = getDOMImplementation()
-        doc = impl.createDocument(None, 'Root', None)
-        root = doc.documentElement
-
-        root.setAttribute('MajorVersion', '1')
-        root.setAttribute('MinorVersion', '2')
-        root.setAttribute('Description', 'EDRM XML Load File')
-        root.setAttribute('Locale', 'US')
-        root.setAttribute('DataInterchangeType', 'Update')
-
-        field_list = doc.createElement("Fields")
-        root.appendChild(field_list)
+        eutes.invalidate_path_prefixes()
+        writer = EDRMWriter(load_file, edrm.configs['encoding'], addindent, newl)
+        if declaration:
+            writer.write_declaration()
+
+        writer.start_element('Root', {'MajorVersion': '1',
+                                      'MinorVersion': '2',
+                                      'Description': 'EDRM XML Load File',
+                                      'Locale': 'US',
+                                      'DataInterchangeType': 'Update'})
+
+        writer.start_element('Fields')
+        field_registry = FieldRegistry()
         for entry_id, entry in self.__entries.items():
             debug_log(f"\tSerializing Fields for {entry_id}: {entry.name}", flush=True)
-            entry.serialize_field_definitions(doc, field_list)
+            entry.serialize_field_definitions(writer, field_registry)
+        writer.end_element()
 
-        batch_element = doc.createElement('Batch')
-        root.appendChild(batch_element)
-        doc_list = doc.createElement('Documents')
-        batch_element.appendChild(doc_list)
+        writer.start_element('Batch')
 
+        writer.start_element('Documents')
         for entry_id, entry in self.__entries.items():
             debug_log(f"\tSerializing File {entry_id}: {entry.name}", flush=True)
-            entry.serialize_entry(doc, doc_list, self.__entries, self.as_nli)
+            entry.serialize_entry(writer, field_registry, self.__entries, self.as_nli)
+        writer.end_element()
 
-        relationship_list = doc.createElement('Relationships')
-        batch_element.appendChild(relationship_list)
+        writer.start_element('Relationships')
         for parent_id, family in self.__families.items():
             debug_log(f"\tBuilding Relationships {parent_id} of {len(family)} items", flush=True)
             for child_id in family:
-                relationship = doc.createElement('Relationship')
-                relationship.setAttribute('Type', 'Container')
-                relationship.setAttribute('ParentDocId', parent_id)
-                relationship.setAttribute('ChildDocId', child_id)
-                relationship_list.appendChild(relationship)
-
-        folders_list = doc.createElement('Folders')
-        batch_element.appendChild(folders_list)
+                writer.empty_element('Relationship', {'Type': 'Container',
+                                                      'ParentDocId': parent_id,
+                                                      'ChildDocId': child_id})
+        writer.end_element()
 
+        writer.start_element('Folders')
         working_families = deepcopy(self.__families)
         for entry_id in self.__families.keys():
             debug_log(f"\tStructuring Family Folder for {entry_id}", flush=True)
             if entry_id in working_families:
-                self.__add_folder(entry_id, doc, folders_list, working_families)
+                self.__write_folder(entry_id, writer, working_families)
+        writer.end_element()
+
+        writer.end_element()
+        writer.end_element()
 
-        return doc
+    def build(self) -> Document:
+        """
+        Create the EDRM load file document, but do not save it to disk.  Call this method only after setting the
+        `as_nli` flag and adding all desired entries.  This is useful when the target location for saving the load file
+        is not to disk, or if there is additional customization of the load file needed.  The `save()` method does not
+        use this method: it writes the load file to disk as it is serialized, without holding the whole document in
+        memory.  So if the target is to save the file to disk without customization, there is no need to call this
+        method explicitly.
+
+        :return: Document containing the serialized load file contents.
+        """
+        load_file = io.StringIO()
+        self.__write(load_file, addindent='', newl='', declaration=False)
+        return parseString(load_file.getvalue())
+
+    def write(self, load_file: TextIO) -> None:
+        """
+        Serialize the EDRM load file to a text stream, formatted the same way `save()` writes it to disk.  Use this
+        method when the load file should go somewhere other than the `output_path`, or when the stream needs to process
+        the text as it is written.  As with `save()`, the load file is written one entry at a time.
+        :param load_file: The text stream to write the load file to
+        :return: None
+        """
+        debug_log(f"Building EDRM file with {len(self.__entries)} entries", flush=True)
+        self.__write(load_file, addindent='  ', newl='\n')
 
     def save(self, doc: Document = None):
         """
         Save the EDRM load file document to the disk.  The `doc` argument is the DOM object containing the EDRM load
-        file XML content.  It is optional, and if not provided, the `build()` method will be called to create it.
-        For most cases, this method should be called without the parameter.
+        file XML content.  It is optional, and if not provided, the load file is serialized directly to disk one
+        entry at a time, so memory use does not grow with the size of the whole load file.  For most cases, this method
+        should be called without the parameter.
 
         This method should be called only after the `output_path` property and `as_nli` flag have been set and all
         desired entries are stored.  The result will be a fully realized EDRM XML Load File in the location specified
@@ -267,10 +339,11 @@ class EDRMBuilder:
                     the load file, modify it, then call this save(doc) method (or store the XML another way).
         :return: None
         """
-        if doc is None:
-            debug_log(f"Building EDRM file with {len(self.__entries)} entries", flush=True)
-            doc = self.build()
-
-        with self.output_path.open(mode='w', encoding=edrm.configs['encoding']) as load_file:
-            debug_log(f"Saving EDRM XML to {str(self.output_path)}", flush=True)
-            doc.writexml(load_file, encoding=edrm.configs['encoding'], standalone=True, addindent='  ', newl='\n')
+        debug_log(f"Saving EDRM XML to {str(self.output_path)}", flush=True)
+        with self.output_path.open(mode='w',
+                                   buffering=edrm.configs['write_buffer_size'],
+                                   encoding=edrm.configs['encoding']) as load_file:
+            if doc is None:
+                self.write(load_file)
+            else:
+                doc.writexml(load_file, encoding=edrm.configs['encoding'], standalone=True, addindent='  ', newl='\n')
@@ -4,7 +4,7 @@ import sys
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Union, Any
+from typing import Union, Any, Callable
 
 from nuix_nli_lib import edrm
 
@@ -43,6 +43,18 @@ def convert_timestamp_to_string(timestamp: float) -> str:
     return convert_datetime_to_string(dt)
 
 
+def _format_datetime_value(value: datetime) -> str:
+    return convert_datetime_to_string(value)
+
+
+def _format_float_value(value: float) -> str:
+    return str(round(value, 4))
+
+
+def _format_none_value(value: None) -> str:
+    return ''
+
+
 def _hash_file(file: Path, hashfunction: hashlib) -> None:
     """
     Intermediate function to update the hash with the contents of the file.
@@ -117,23 +129,37 @@ def hash_directory(directory: Path, hashfunction: hashlib, as_string: bool = Tru
         return hashfunction.digest()
 
 
+path_prefix_generation: int = 0
+"""
+Counts the times the path prefixes memoized by `generate_relative_path` have been invalidated.  Entries only reuse a
+prefix that was memoized in the current generation.
+"""
+
+
+def invalidate_path_prefixes() -> None:
+    """
+    Forget the path prefixes memoized by `generate_relative_path`.  Call this when entries may have changed since their
+    relative paths were last generated, such as at the start of each build of an EDRM file.
+    :return: None
+    """
+    global path_prefix_generation
+    path_prefix_generation += 1
+
+
 def generate_relative_path(entry: object, entry_map: dict[str, object]) -> str:
     """
-    Generate a relative path for the provided entry.  The path is calculated by recursively walking up each parent-layer
-    and adding the parent's name to the start of the path, stopping when there is no parent.  The path will include
-    the entry's name.
+    Generate a relative path for the provided entry.  The path is the entry's name, prefixed by the path each
+    parent-layer adds for its children (see EntryInterface.path_prefix), stopping when there is no parent.  The
+    parents' prefixes are memoized, so siblings and cousins do not each walk the full parent chain.  The memo lasts
+    until `invalidate_path_prefixes` is next called.
     :param entry: An instance of the EntryInterface class to generate a relative path for
     :param entry_map: A mapping of the entries known for the EDRM file, so parent entries can be located
     :return:  A string containing the relative path to the entry from the root of the container for this EDRM file
     """
-    relative_path = entry.name
-
-    tmp_current_entry = entry
-    while tmp_current_entry.parent is not None:
-        tmp_current_entry = entry_map[tmp_current_entry.parent]
-        relative_path = tmp_current_entry.add_as_parent_path(relative_path)
+    if entry.parent is None:
+        return entry.name
 
-    return relative_path
+    return entry_map[entry.parent].path_prefix(entry_map) + entry.name
 
 
 ILLEGAL_UNI_CHARS = [(0x00, 0x08), (0x0B, 0x0C), (0x0E, 0x1F),
@@ -158,6 +184,40 @@ def sanitize_xml_content(content: str) -> str:
     return XML_ILLEGAL_CHARS_COMPILED_RE.sub('_', content)
 
 
+_value_formatters: dict[type, Callable[[Any], str]] = {
+    str: sanitize_xml_content,
+    int: str,
+    bool: str,
+    float: _format_float_value,
+    datetime: _format_datetime_value,
+    type(None): _format_none_value,
+}
+"""
+Maps the exact type of a field value to the function used to convert it to text, so the common value types are
+formatted with a single dictionary lookup.  Numbers can not contain characters that are illegal in XML, so they are
+converted without being sanitized.
+"""
+
+
+def format_field_value(value: Any) -> str:
+    """
+    Convert a field's value to the text stored for it in the EDRM load file.  None is stored as an empty string,
+    datetimes are converted with `convert_datetime_to_string`, floats are rounded to four decimal places, and all other
+    values are converted to strings with any characters that are illegal in XML replaced.
+    :param value: The field value to convert
+    :return: The text to write as the field's value
+    """
+    formatter = _value_formatters.get(type(value))
+    if formatter is not None:
+        return formatter(value)
+    elif isinstance(value, datetime):
+        return _format_datetime_value(value)
+    elif isinstance(value, float):
+        return _format_float_value(value)
+    else:
+        return sanitize_xml_content(str(value))
+
+
 FILE_INVALID_CHARS = [
     '<', '>', ':', '"', '/', '|', '?', '*',  # Illegal symbols
     '\\', '\\\\',                            # Backslashes (Windows illegal)
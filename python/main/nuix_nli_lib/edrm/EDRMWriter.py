@@ -0,0 +1,182 @@
+import io
+from typing import TextIO, Hashable, Callable, Any
+from xml.sax.saxutils import XMLGenerator, escape, quoteattr
+
+
+class EDRMWriter:
+    """
+    Streaming writer used to serialize the EDRM load file.  Elements are written to the output as they are produced,
+    using xml.sax.saxutils.XMLGenerator, rather than being built into a DOM tree and written at the end.  Text and
+    attribute values are escaped by the XMLGenerator, or with the xml.sax.saxutils functions it uses for elements
+    written directly to the output.
+
+    The output is indented the same way xml.dom.minidom indents a document: an element containing other elements has
+    its children on their own lines, indented by `addindent` for each level, an element containing only text is written
+    on a single line, and an element with no content is closed immediately (<Element/>).
+
+    Elements with children are opened with `start_element` and must be closed with a matching `end_element`.  Elements
+    with only text are written with `text_element`, and elements with no content are written with `empty_element`:
+    <code>
+    writer.start_element('Files')
+    writer.start_element('File', {'FileType': 'Native'})
+    writer.empty_element('ExternalFile', {'FilePath': 'natives', 'FileName': 'example.txt'})
+    writer.end_element()
+    writer.end_element()
+    writer.text_element('LocationURI', 'natives/example.txt')
+    </code>
+    """
+
+    def __init__(self, output: TextIO, encoding: str, addindent: str = '  ', newl: str = '\n'):
+        """
+        :param output: Text stream to write the XML to
+        :param encoding: The encoding the output will be stored with, used in the XML declaration
+        :param addindent: The indentation to add for each level of nesting
+        :param newl: The string written to end each line
+        """
+        self.__output = output
+        self.__write = output.write
+        self.__encoding = encoding
+        self.__generator = XMLGenerator(output, encoding, short_empty_elements=True)
+        self.__addindent = addindent
+        self.__newl = newl
+        # The XMLGenerator leaves a start tag open until it writes something more, so elements are only written
+        # straight to the output when the whitespace written before each of them will close their parent's start tag
+        self.__write_directly: bool = bool(newl or addindent)
+
+        self.__open_elements: list[str] = []
+        self.__has_children: list[bool] = []
+        self.__indent: str = ''
+
+        self.__cached_elements: dict[tuple[Hashable, int], tuple[str, list[str]]] = {}
+
+    def write_declaration(self) -> None:
+        """
+        Write the XML declaration.  This must be called before any elements are written, if it is called at all.
+        :return: None
+        """
+        self.__output.write(f'<?xml version="1.0" encoding="{self.__encoding}" standalone="yes"?>{self.__newl}')
+
+    def __begin_element(self) -> None:
+        """
+        Internal method that writes the whitespace preceding a new element.  The first child of an element also ends the
+        line its parent's start tag is on.
+        """
+        if self.__has_children and not self.__has_children[-1]:
+            self.__has_children[-1] = True
+            self.__generator.ignorableWhitespace(self.__newl + self.__indent)
+        else:
+            self.__generator.ignorableWhitespace(self.__indent)
+
+    def start_element(self, name: str, attributes: dict[str, str] = None) -> None:
+        """
+        Open an element which will contain other elements.  Close it with `end_element` once its children are written.
+        :param name: The element's tag name
+        :param attributes: Optional attribute names and values for the element, written in order
+        :return: None
+        """
+        self.__begin_element()
+        self.__generator.startElement(name, attributes or {})
+
+        self.__open_elements.append(name)
+        self.__has_children.append(False)
+        self.__indent += self.__addindent
+
+    def end_element(self) -> None:
+        """
+        Close the most recently opened element.
+        :return: None
+        """
+        name = self.__open_elements.pop()
+        has_children = self.__has_children.pop()
+        self.__indent = self.__indent[:len(self.__indent) - len(self.__addindent)]
+
+        if has_children:
+            self.__generator.ignorableWhitespace(self.__indent)
+        self.__generator.endElement(name)
+        self.__generator.ignorableWhitespace(self.__newl)
+
+    def text_element(self, name: str, text: str, attributes: dict[str, str] = None) -> None:
+        """
+        Write a complete element whose only content is text.
+        :param name: The element's tag name
+        :param text: The text content of the element
+        :param attributes: Optional attribute names and values for the element, written in order
+        :return: None
+        """
+        self.__begin_element()
+        if not self.__write_directly:
+            self.__generator.startElement(name, attributes or {})
+            if text:
+                self.__generator.characters(text)
+            self.__generator.endElement(name)
+            return
+
+        # Text elements make up most of the load file, so they are written straight to the output a piece at a time
+        # rather than going through the XMLGenerator's element events
+        write = self.__write
+        write('<')
+        write(name)
+        if attributes:
+            for attribute_name, value in attributes.items():
+                write(' ')
+                write(attribute_name)
+                write('=')
+                write(quoteattr(value))
+        if text:
+            write('>')
+            write(escape(text))
+            write('</')
+            write(name)
+            write('>')
+        else:
+            write('/>')
+        write(self.__newl)
+
+    def empty_element(self, name: str, attributes: dict[str, str] = None) -> None:
+        """
+        Write a complete element with no content.
+        :param name: The element's tag name
+        :param attributes: Optional attribute names and values for the element, written in order
+        :return: None
+        """
+        self.__begin_element()
+        self.__generator.startElement(name, attributes or {})
+        self.__generator.endElement(name)
+        self.__generator.ignorableWhitespace(self.__newl)
+
+    def write_cached(self, key: Hashable, write: Callable[..., None], *args: Any) -> None:
+        """
+        Write a run of elements that is identical every time it is written, such as boilerplate shared by every entry.
+        The first time `key` is written at a given depth, `write(writer, *args)` is called to render the elements into
+        a string, which is kept for the lifetime of this writer and written directly for every later use of `key` at
+        that depth.
+
+        `write` may leave elements open for the caller to add more children to and close with `end_element`, but each
+        element it leaves open must already contain at least one child element.
+        :param key: Identifies the rendered elements.  It must account for anything that changes their contents.
+        :param write: Function that writes the elements, taking an EDRMWriter and `args`
+        :param args: Additional arguments for `write`
+        :return: None
+        """
+        depth = len(self.__open_elements)
+        cached = self.__cached_elements.get((key, depth))
+        if cached is None:
+            rendered = io.StringIO()
+            template = EDRMWriter(rendered, self.__encoding, self.__addindent, self.__newl)
+            template.__indent = self.__indent
+            write(template, *args)
+            if not all(template.__has_children):
+                raise ValueError(f'Cached elements for {key} leave an element open with no content')
+
+            cached = (rendered.getvalue(), template.__open_elements)
+            self.__cached_elements[(key, depth)] = cached
+
+        text, open_elements = cached
+        if self.__has_children and not self.__has_children[-1]:
+            self.__has_children[-1] = True
+            text = self.__newl + text
+        self.__generator.ignorableWhitespace(text)
+
+        self.__open_elements.extend(open_elements)
+        self.__has_children.extend(True for _ in open_elements)
+        self.__indent += self.__addindent * len(open_elements)
@@ -1,9 +1,7 @@
-from datetime import datetime
 from typing import Any
 
-from xml.dom.minidom import Element, Document, Node
-
 from nuix_nli_lib.edrm import EDRMUtilities as eutes
+from nuix_nli_lib.edrm.EDRMWriter import EDRMWriter
 
 
 class EntryField:
@@ -78,49 +76,29 @@ class EntryField:
         """
         self.__value = value
 
-    def serialize_definition(self, document: Document, field_list: Element) -> None:
+    def serialize_definition(self, writer: EDRMWriter, key: str = None) -> None:
         """
         Fields are stored in two parts in the EDRM file.  At the top of the file, their definitions are stored,
         providing the name and key mapping, as well as the type of the value stored in the field.  This function is
         responsible for writing that definition to the EDRM XML file.
 
-        This method ensures a field with the provided name is only stored in the XML file once.
+        A field with a given name should only be stored in the XML file once.  That is left to the caller, see
+        EntryInterface.serialize_field_definitions.
 
-        :param document: The DOM document to write the definition to.
-        :param field_list: The container DOM element to add the definition to.
+        :param writer: The writer for the EDRM load file, positioned inside the Fields element.
+        :param key: The Key the load file uses for this field.  Defaults to this field's `key`.
         :return: None
         """
-        for sibling in field_list.childNodes:
-            if sibling.nodeType == Node.ELEMENT_NODE and sibling.getAttribute("Name") == self.name:
-                return
-
-        field_element: Element = document.createElement("Field")
-        field_element.setAttribute("Name", self.name)
-        field_element.setAttribute("DataType", self.data_type)
-        field_element.setAttribute("Key", self.key)
-
-        field_list.appendChild(field_element)
+        writer.empty_element('Field', {'Name': self.name, 'DataType': self.data_type, 'Key': key or self.key})
 
-    def serialize_value(self, document: Document, value_list: Element) -> None:
+    def serialize_value(self, writer: EDRMWriter, key: str = None) -> None:
         """
         Fields are stored in two parts in the EDRM file.  For each Entry in the file which has a value for a given
         field, the Field and its value are written, using the Field's Key as the XML Node name.  This function is
         responsible for writing that value to the EDRM XML file.
 
-        :param document: The DOM document to write the value to.
-        :param value_list: The DOM element to add the value to.
+        :param writer: The writer for the EDRM load file, positioned inside the entry's FieldValues element.
+        :param key: The Key the load file uses for this field.  Defaults to this field's `key`.
         :return: None
         """
-        value_element: Element = document.createElement(self.key)
-
-        if self.value is None:
-            value_text = ''
-        elif isinstance(self.value, datetime):
-            value_text = eutes.convert_datetime_to_string(self.value)
-        elif isinstance(self.value, float):
-            value_text = str(round(self.value, 4))
-        else:
-            value_text = eutes.sanitize_xml_content(str(self.value))
-
-        value_element.appendChild(document.createTextNode(value_text))
-        value_list.appendChild(value_element)
\ No newline at end of file
+        writer.text_element(key or self.key, eutes.format_field_value(self.value))
\ No newline at end of file
@@ -1,11 +1,21 @@
 from datetime import datetime
-from typing import Iterable, Any, Tuple, Iterator
-from xml.dom.minidom import Element, Document
-
-from nuix_nli_lib.edrm import EntryField
+from typing import Iterable, Any, Tuple, Iterator, Callable
+from nuix_nli_lib.edrm import EntryField, EDRMWriter, FieldRegistry, EDRMUtilities as eutes
 from nuix_nli_lib import edrm
 
 
+def _write_location_header(writer: EDRMWriter, for_nli: bool) -> None:
+    """
+    Internal function that opens the Locations and Location elements and writes the Custodian and Description.
+    """
+    writer.start_element('Locations')
+    writer.start_element('Location')
+
+    writer.text_element('Custodian', edrm.configs['custodian'])
+    description_text: str = 'Location within Nuix case file' if for_nli else 'Location on Disk'
+    writer.text_element('Description', description_text)
+
+
 class EntryInterface(object):
     """
     Basic interface for items that will go into an EDRM XML file.  This provides an interface for all types of entries
@@ -15,11 +25,15 @@ class EntryInterface(object):
 
     def __init__(self):
         self.__row_fields: dict[str, EntryField] = {}
+        self.__field_builders: dict[str, Callable[[], EntryField]] = {}
+        self.__identifier_entry_field: EntryField = None
+        self.__path_prefix: tuple[tuple[int, int], str] = (None, '')
 
     @property
     def fields(self) -> Iterable[str]:
         """
-        :return: Iterable over the names of the fields with data in this entry
+        :return: Iterable over the names of the fields with data in this entry, including lazy fields which have not
+                 been built yet.
         """
         return self.__row_fields.keys()
 
@@ -30,6 +44,17 @@ class EntryInterface(object):
         """
         raise NotImplementedError
 
+    @property
+    def identifier(self) -> str:
+        """
+        :return: The value of this entry's identifier field, which is the entry's unique ID in the load file.  The
+                 identifier field itself is cached after it is first read, rather than its value, so changes made to
+                 the field's value are always seen.  The cache is cleared whenever a field is assigned to the entry.
+        """
+        if self.__identifier_entry_field is None:
+            self.__identifier_entry_field = self[self.identifier_field]
+        return self.__identifier_entry_field.value
+
     @property
     def name(self) -> str:
         """
@@ -58,6 +83,27 @@ class EntryInterface(object):
         """
         raise NotImplementedError
 
+    def add_lazy_field(self, field_name: str, field_builder: Callable[[], EntryField]) -> None:
+        """
+        Register a field whose EntryField is only built the first time it is accessed (either directly, or when the
+        entry's fields are iterated for serialization).  The field keeps its position amongst the other fields, so the
+        order fields are written to the load file does not depend on when they are built.
+        :param field_name: Name of the field being registered
+        :param field_builder: Callable taking no arguments that produces the EntryField for this entry.  It will be
+                              called at most once.
+        :return: None
+        """
+        self.__row_fields[field_name] = None
+        self.__field_builders[field_name] = field_builder
+
+    def __build_lazy_field(self, field_name: str) -> EntryField:
+        """
+        Internal method that builds a lazy field and stores it in place of its placeholder.
+        """
+        field = self.__field_builders.pop(field_name)()
+        self.__row_fields[field_name] = field
+        return field
+
     def set_field_value(self, field_name: str, field_value: Any):
         """
         Set the value of a field in this entry.  This function assumes the field is already defined, and just adjusts
@@ -67,58 +113,93 @@ class EntryInterface(object):
         :return: None
         :raise KeyError: If the there is no field with the provided name
         """
-        if field_name in self.fields:
-            self[field_name] = field_value
-        else:
+        try:
+            field = self.__row_fields[field_name]
+        except KeyError:
             raise KeyError(f'Field {field_name} does not exist for this entry.')
 
-    def serialize_field_definitions(self, document: Document, field_list: Element):
+        if field is None and field_name in self.__field_builders:
+            field = self.__build_lazy_field(field_name)
+        field.value = field_value
+
+    def serialize_field_definitions(self, writer: EDRMWriter, field_registry: FieldRegistry):
         """
-        Add this entry's fields to the XML document.
-        :param document: XML Document representing the EDRM Load File
-        :param field_list: The container XML Element to hold the fields.
+        Write the definitions of this entry's fields to the EDRM Load File.  A field is only defined once per file, so
+        fields whose names already have a Key in `field_registry` are skipped, and newly defined fields are assigned
+        their Key from it.
+        :param writer: The writer for the EDRM Load File, positioned inside the Fields element
+        :param field_registry: The registry of Keys for the fields in the Load File
         :return: None
         """
         for field_name, field in self:
-            field.serialize_definition(document, field_list)
+            if field.name not in field_registry:
+                field.serialize_definition(writer, field_registry.key_for(field.name))
 
-    def serialize_field_values(self, document: Document, value_list: Element):
+    def serialize_field_values(self, writer: EDRMWriter, field_registry: FieldRegistry):
         """
-        Add the values for each field to the XML document.
-        :param document: XML Document representing the EDRM Load File
-        :param value_list: The container XML Element to hold the field values
+        Write the values for each field to the EDRM Load File.
+        :param writer: The writer for the EDRM Load File, positioned inside the FieldValues element
+        :param field_registry: The registry of Keys for the fields in the Load File
         :return: None
         """
         for field_name, field in self:
-            field.serialize_value(document, value_list)
+            field.serialize_value(writer, field_registry.key_for(field.name))
 
     def add_as_parent_path(self, existing_path: str):
         """
         Add this entry to the existing path as the path's parent, if appropriate.  The default is to do nothing,
-        assuming this type of entry does not represent a physical location.  Subclasses can override this behavior.
+        assuming this type of entry does not represent a physical location.  Subclasses can override this behavior,
+        but should only ever add a prefix to existing_path (such as f'{self.name}/{existing_path}'), since the prefix
+        is calculated once and shared by all of this entry's descendants.  See `path_prefix`.
         :param existing_path: The existing (possibly child) path to adjust with this entry as a parent
         :return: The extended path including this entry as a parent if appropriate for this type
         """
         return existing_path
 
-    def add_doc(self, document: Document, container: Element) -> Element:
+    def path_prefix(self, entry_map: dict[str, object]) -> str:
+        """
+        Get the prefix this entry and its ancestors add to the relative paths of this entry's children.  The prefix is
+        memoized on each entry, so entries sharing ancestors only walk up to the first ancestor whose prefix is already
+        known.  The memo is keyed by the identity of entry_map and the current `EDRMUtilities.path_prefix_generation`,
+        rather than holding on to entry_map itself.
+        :param entry_map: A mapping of the entries known for the EDRM file, so parent entries can be located
+        :return: The path to prepend to a child entry's name to get its relative path
         """
-        An Enry is represented as a Document element in the EDRM Load File.  This method generates the top level of the
-        document element representing this Entry and adds it to container.
+        memo_key = (id(entry_map), eutes.path_prefix_generation)
+        cached_key, prefix = self.__path_prefix
+        if cached_key == memo_key:
+            return prefix
 
-        :param document: The DOM Document to add the document to
-        :param container: The DOM Element to add the document to
-        :return: The newly created DOM Document element
+        # Walk up to the first ancestor with a known prefix, then fill in prefixes on the way back down
+        lineage = [self]
+        prefix = ''
+        while lineage[-1].parent is not None:
+            parent = entry_map[lineage[-1].parent]
+            cached_key, parent_prefix = parent.__path_prefix
+            if cached_key == memo_key:
+                prefix = parent_prefix
+                break
+            lineage.append(parent)
+
+        for ancestor in reversed(lineage):
+            prefix += ancestor.add_as_parent_path('')
+            ancestor.__path_prefix = (memo_key, prefix)
+
+        return prefix
+
+    def add_doc(self, writer: EDRMWriter) -> None:
         """
-        doc_element = document.createElement('Document')
-        doc_element.setAttribute('DocID', self[self.identifier_field].value)
-        doc_element.setAttribute('DocType', 'File')
-        doc_element.setAttribute('MimeType', self['MIME Type'].value)
-        container.appendChild(doc_element)
+        An Enry is represented as a Document element in the EDRM Load File.  This method opens the document element
+        representing this Entry.  The element's contents are written after it, and it is closed by `serialize_entry`.
 
-        return doc_element
+        :param writer: The writer for the EDRM Load File, positioned inside the Documents element
+        :return: None
+        """
+        writer.start_element('Document', {'DocID': self.identifier,
+                                          'DocType': 'File',
+                                          'MimeType': self['MIME Type'].value})
 
-    def add_file(self, document: Document, container: Element, entry_map: dict[str, object], for_nli: bool) -> None:
+    def add_file(self, writer: EDRMWriter, entry_map: dict[str, object], for_nli: bool) -> None:
         """
         File Elements are responsible for locating an Entry's natives on the source file system (and in the case of an
         NLI file or other container, locating it within that container), while the LocationURI  is responsible for
@@ -133,33 +214,27 @@ class EntryInterface(object):
           </File>
         </code>
         The Files and File elements are optional, so it is valid for this method to do nothing.
-        :param document: The DOM object representing the EDRM Load File
-        :param container: The DOM Element to which the Files collection element is added.
+        :param writer: The writer for the EDRM Load File, positioned inside the Document element
         :param entry_map: The dictionary of Entry IDs to their corresponding EnryImplementation instance
         :param for_nli: True if this EDRM load file is targetting an NLI
         :return: None
         """
         raise NotImplementedError
 
-    def add_location_uri(self, document: Document, container: Element, entry_map: dict[str, object], for_nli: bool):
+    def add_location_uri(self, writer: EDRMWriter, entry_map: dict[str, object], for_nli: bool):
         """
         The Location URI is used to locate the document file or files inside the Case once it is built.  This method
         is responsible for adding the URI to the document.  It is responsible for making the
         <LocationURI>...</LocationURI> element and building the address which will populate it.  Not all Documents
         will have a corresponding file, and so may not need a Location URI, so it is valid for this method to do nothing.
-        :param document: The DOM object representing the EDRM Load File
-        :param container: The DOM Element to which the LocationURI collection element is added
+        :param writer: The writer for the EDRM Load File, positioned inside the Location element
         :param entry_map: The dictionary of Entry IDs to their corresponding EnryImplementation instance
         :param for_nli: True if this EDRM load file is targetting an NLI
         :return: None
         """
         raise NotImplementedError
 
-    def add_location(self,
-                     document: Document,
-                     container: Element,
-                     entry_map: dict[str, object],
-                     for_nli: bool) -> None:
+    def add_location(self, writer: EDRMWriter, entry_map: dict[str, object], for_nli: bool) -> None:
         """
         A Document can have one or more Files associated with it.  The Location elements are responsible for defining
         where those files are located in the resulting Case structure.  The Location element also is responsible for
@@ -178,56 +253,51 @@ class EntryInterface(object):
         This method is responsible for adding the location collection (<Locations>), the location element (<Location>)
         and the custodian (<Custodian>).  The default implementation also adds a description.  The default also calls
         the `add_location_uri` method to add the <LocationURI> element, but that element is optional.
-        :param document: The DOM object representing the EDRM Load File
-        :param container: The DOM Element to which the Location collection element (<Locations>) is added
+        :param writer: The writer for the EDRM Load File, positioned inside the Document element
         :param entry_map: The dictionary of Entry IDs to their corresponding EnryImplementation instance
         :param for_nli:True if this EDRM load file is targetting an NLI
         :return:
         """
-        location_list = document.createElement('Locations')
-        container.appendChild(location_list)
-
-        location = document.createElement('Location')
-        location_list.appendChild(location)
-
-        custodian_element = document.createElement('Custodian')
-        custodian_element.appendChild(document.createTextNode(edrm.configs['custodian']))
-        location.appendChild(custodian_element)
-
-        description_element = document.createElement('Description')
-        description_text: str = 'Location within Nuix case file' if for_nli else 'Location on Disk'
-        description_element.appendChild(document.createTextNode(description_text))
-        location.appendChild(description_element)
+        # The Locations boilerplate is the same for every entry in the load file, so it is only rendered once
+        writer.write_cached(('Locations', for_nli), _write_location_header, for_nli)
+        self.add_location_uri(writer, entry_map, for_nli)
 
-        self.add_location_uri(document, location, entry_map, for_nli)
+        writer.end_element()
+        writer.end_element()
 
     def serialize_entry(self,
-                        document: Document,
-                        entry_container: Element,
+                        writer: EDRMWriter,
+                        field_registry: FieldRegistry,
                         entry_map: dict[str, object],
                         for_nli: bool = False) -> None:
         """
         This method is responsible for orchestrating the writing the representation of this Entry instance to
         XML.
-        :param document: The DOM object representing the EDRM Load File
-        :param entry_container: The DOM element to which this document will be added.
+        :param writer: The writer for the EDRM Load File, positioned inside the Documents element
+        :param field_registry: The registry of Keys for the fields in the Load File
         :param entry_map: The dictionary of Entry IDs to their corresponding EnryImplementation instance
         :param for_nli: True if this EDRM load file is targetting an NLI
         :return: None
         """
-        doc_element = self.add_doc(document, entry_container)
+        self.add_doc(writer)
 
-        value_list = document.createElement('FieldValues')
-        doc_element.appendChild(value_list)
-        self.serialize_field_values(document, value_list)
+        writer.start_element('FieldValues')
+        self.serialize_field_values(writer, field_registry)
+        writer.end_element()
 
-        self.add_file(document, doc_element, entry_map, for_nli)
-        self.add_location(document, doc_element, entry_map, for_nli)
+        self.add_file(writer, entry_map, for_nli)
+        self.add_location(writer, entry_map, for_nli)
+
+        writer.end_element()
 
     def __iter__(self) -> Iterator[Tuple[str, Any]]:
         """
         :return: An iterable over the fields in this entry
         """
+        if self.__field_builders:
+            for field_name in list(self.__field_builders):
+                self.__build_lazy_field(field_name)
+
         return iter(self.__row_fields.items())
 
     def __setitem__(self, field_name: str, value: EntryField):
@@ -239,7 +309,9 @@ class EntryInterface(object):
         :param value: Value to assign to the field
         :return: None
         """
+        self.__field_builders.pop(field_name, None)
         self.__row_fields[field_name] = value
+        self.__identifier_entry_field = None
 
     def __getitem__(self, field_name: str) -> EntryField:
         """
@@ -249,4 +321,8 @@ class EntryInterface(object):
         :return: The value stored for the field, or None if the field hasn't been set.
         :raise KeyError: If there is no field with the provided name
         """
-        return self.__row_fields[field_name]
+        field = self.__row_fields[field_name]
+        if field is None and field_name in self.__field_builders:
+            field = self.__build_lazy_field(field_name)
+
+        return field
@@ -1,9 +1,13 @@
 from typing import Any
 
 from nuix_nli_lib.edrm.EntryField import EntryField
+from nuix_nli_lib.edrm.FieldRegistry import FieldRegistry
 
-next_key_index: int = 0
-""" Counter for the known set of fields, such as to provide unique names for each field node """
+default_registry: FieldRegistry = FieldRegistry()
+"""
+Registry used to generate fields for entries.  The keys it assigns are only used to identify fields on the entries;
+the keys written to a load file are assigned by the EDRMBuilder's own registry when the file is written.
+"""
 
 
 def next_key():
@@ -15,13 +19,10 @@ def next_key():
 
     :return: The next key name to use in sequence, in the format "field_n"
     """
-    global next_key_index
-    field_id: int = next_key_index
-    next_key_index += 1
-    return f'field_{field_id}'
+    return default_registry.next_key()
 
 
-field_name_key_map: dict[str, str] = {}
+field_name_key_map: dict[str, str] = default_registry.name_key_map
 """
 Maps the names of a EDRM Field to their Key, such that a Field that has already been created can be looked up to find
 the Key needed for representing the Field's value.
@@ -38,10 +39,4 @@ def generate_field(field_name: str, field_type: str, default_value: Any) -> Entr
     :param default_value: Value to provide a field for a document when it has the Field Key but no value is provided.
     :return: A new instance of EntryField with the provided parameters and a Key uniquely identifying the field (name).
     """
-    if field_name in field_name_key_map:
-        field_key = field_name_key_map[field_name]
-    else:
-        field_key = next_key()
-        field_name_key_map[field_name] = field_key
-
-    return EntryField(field_key, field_name, field_type, default_value)
\ No newline at end of file
+    return default_registry.generate_field(field_name, field_type, default_value)
@@ -0,0 +1,70 @@
+import itertools
+from typing import Any
+
+from nuix_nli_lib.edrm.EntryField import EntryField
+
+
+class FieldRegistry:
+    """
+    Manages the Keys for a set of EDRM Fields.  Keys are used as the names of XML Nodes identifying the field values for
+    each entry in an EDRM load file.  Fields are first listed with their definition once, and are provided a key, which
+    then links that definition to the XML node that provides the values for the document.  Each field's name must be
+    unique within the context of the EDRM load file, and the registry hands out one key per field name, in sequence.
+
+    Each EDRMBuilder uses its own registry when it writes a load file, so the keys in a load file only depend on the
+    fields in that load file, and separate builds do not share any state.  The FieldFactory functions use a shared,
+    default registry to generate fields for entries.
+    """
+
+    def __init__(self):
+        self.__key_counter = itertools.count()
+        self.__name_key_map: dict[str, str] = {}
+
+    @property
+    def name_key_map(self) -> dict[str, str]:
+        """
+        :return: Maps the names of the registered Fields to their Key, such that a Field that has already been created
+                 can be looked up to find the Key needed for representing the Field's value.
+        """
+        return self.__name_key_map
+
+    def next_key(self) -> str:
+        """
+        Generate a unique key in this registry's sequence.
+        :return: The next key name to use in sequence, in the format "field_n"
+        """
+        return f'field_{next(self.__key_counter)}'
+
+    def key_for(self, field_name: str) -> str:
+        """
+        Get the Key for the named field, assigning it the next key in sequence if it has not been registered yet.
+        :param field_name: The name of the field as you would expect it to appear in the final Case
+        :return: The Key for the field
+        """
+        field_key = self.__name_key_map.get(field_name)
+        if field_key is None:
+            field_key = self.next_key()
+            self.__name_key_map[field_name] = field_key
+
+        return field_key
+
+    def generate_field(self, field_name: str, field_type: str, default_value: Any) -> EntryField:
+        """
+        Given the field definition as provided in the parameters, create a new EntryField with a unique Key.  If a Field
+        Name already exists the existing Key will be used.  However, in all cases a new EntryField instance will be
+        created as the Field will also hold the value specific to a single Entry.
+        :param field_name: The name of the field as you would expect it to appear in the final Case
+        :param field_type: The type of data to store in the Field.  Should be one of the edrm.EntryField.TYPE_* constants
+        :param default_value: Value to provide a field for a document when it has the Field Key but no value is
+                              provided.
+        :return: A new instance of EntryField with the provided parameters and a Key uniquely identifying the field
+                 (name).
+        """
+        return EntryField(self.key_for(field_name), field_name, field_type, default_value)
+
+    def __contains__(self, field_name: str) -> bool:
+        """
+        :param field_name: The name of the field to check for
+        :return: True if a Key has already been assigned to the named field
+        """
+        return field_name in self.__name_key_map
@@ -2,9 +2,8 @@ import hashlib
 import urllib.parse
 from datetime import datetime
 from pathlib import Path
-from xml.dom.minidom import Document, Element
 
-from nuix_nli_lib.edrm import FieldFactory, EntryField, EntryInterface, EDRMUtilities as eutes
+from nuix_nli_lib.edrm import FieldFactory, EntryField, EntryInterface, EDRMWriter, EDRMUtilities as eutes
 
 
 class FileEntry(EntryInterface):
@@ -47,43 +46,71 @@ class FileEntry(EntryInterface):
         super().__init__()
 
         self.__file_path = Path(file_path).absolute().resolve()
+        self.__name = self.__file_path.name
+        self.__stat = self.__file_path.stat()
         self.__parent_id = parent_id
         self.__item_date = None
 
         self.fill_basic_fields(mime_type)
 
     def fill_basic_fields(self, mime_type: str):
+        """
+        Add the standard file fields to this entry.  Fields derived from the file's stat block are registered as lazy
+        fields, and are only formatted when they are first accessed.
+        """
         self['MIME Type'] = FieldFactory.generate_field('MIME Type', EntryField.TYPE_TEXT, mime_type)
-        self.__item_date = datetime.fromtimestamp(self.file_path.stat().st_ctime)
-        self['Item Date'] = FieldFactory.generate_field('Item Date',
-                                                        EntryField.TYPE_DATETIME,
-                                                        eutes.convert_datetime_to_string(self.__item_date))
-        self['Path Name'] = FieldFactory.generate_field('Path Name',
-                                                        EntryField.TYPE_TEXT,
-                                                        str(self.file_path.resolve().absolute()))
-        self['File Accessed'] = FieldFactory.generate_field('File Accessed',
-                                                            EntryField.TYPE_DATETIME,
-                                                            eutes.convert_timestamp_to_string(
-                                                                self.file_path.stat().st_atime))
-        self['File Created'] = FieldFactory.generate_field('File Created',
-                                                           EntryField.TYPE_DATETIME,
-                                                           eutes.convert_timestamp_to_string(
-                                                               getattr(self.file_path.stat(),
-                                                                       'st_birthtime',
-                                                                       self.file_path.stat().st_ctime)))
-        self['File Modified'] = FieldFactory.generate_field('File Modified',
-                                                            EntryField.TYPE_DATETIME,
-                                                            eutes.convert_timestamp_to_string(
-                                                                self.file_path.stat().st_mtime))
-        self['File Owner'] = FieldFactory.generate_field('File Owner',
-                                                         EntryField.TYPE_TEXT,
-                                                         getattr(self.file_path.stat(), 'st_creator', 'Undefined'))
-        self['Name'] = FieldFactory.generate_field('Name', EntryField.TYPE_TEXT, str(self.file_path.name))
+        self.add_lazy_field('Item Date', self.__build_item_date)
+        self.add_lazy_field('Path Name', self.__build_path_name)
+        self.add_lazy_field('File Accessed', self.__build_file_accessed)
+        self.add_lazy_field('File Created', self.__build_file_created)
+        self.add_lazy_field('File Modified', self.__build_file_modified)
+        self.add_lazy_field('File Owner', self.__build_file_owner)
+        self['Name'] = FieldFactory.generate_field('Name', EntryField.TYPE_TEXT, self.__name)
 
         self.fill_hash_fields()
 
-        self['File Size'] = FieldFactory.generate_field('File Size', EntryField.TYPE_INTEGER,
-                                                        str(self.file_path.stat().st_size))
+        self.add_lazy_field('File Size', self.__build_file_size)
+
+    def __stat_item_date(self) -> datetime:
+        """
+        Internal method that gets the file's Item Date from its stat block, computing it the first time it is needed.
+        The Item Date field is built from this rather than `itemdate`, which subclasses may override.
+        """
+        if self.__item_date is None:
+            self.__item_date = datetime.fromtimestamp(self.__stat.st_ctime)
+        return self.__item_date
+
+    def __build_item_date(self) -> EntryField:
+        return FieldFactory.generate_field('Item Date',
+                                           EntryField.TYPE_DATETIME,
+                                           eutes.convert_datetime_to_string(self.__stat_item_date()))
+
+    def __build_path_name(self) -> EntryField:
+        return FieldFactory.generate_field('Path Name', EntryField.TYPE_TEXT, str(self.file_path))
+
+    def __build_file_accessed(self) -> EntryField:
+        return FieldFactory.generate_field('File Accessed',
+                                           EntryField.TYPE_DATETIME,
+                                           eutes.convert_timestamp_to_string(self.__stat.st_atime))
+
+    def __build_file_created(self) -> EntryField:
+        return FieldFactory.generate_field('File Created',
+                                           EntryField.TYPE_DATETIME,
+                                           eutes.convert_timestamp_to_string(
+                                               getattr(self.__stat, 'st_birthtime', self.__stat.st_ctime)))
+
+    def __build_file_modified(self) -> EntryField:
+        return FieldFactory.generate_field('File Modified',
+                                           EntryField.TYPE_DATETIME,
+                                           eutes.convert_timestamp_to_string(self.__stat.st_mtime))
+
+    def __build_file_owner(self) -> EntryField:
+        return FieldFactory.generate_field('File Owner',
+                                           EntryField.TYPE_TEXT,
+                                           getattr(self.__stat, 'st_creator', 'Undefined'))
+
+    def __build_file_size(self) -> EntryField:
+        return FieldFactory.generate_field('File Size', EntryField.TYPE_INTEGER, str(self.__stat.st_size))
 
     def fill_hash_fields(self):
         self['SHA-1'] = FieldFactory.generate_field('SHA-1',
@@ -104,7 +131,7 @@ class FileEntry(EntryInterface):
 
     @property
     def name(self) -> str:
-        return self['Name'].value
+        return self.__name
 
     @property
     def time_field(self) -> str:
@@ -112,7 +139,7 @@ class FileEntry(EntryInterface):
 
     @property
     def itemdate(self) -> datetime:
-        return self.__item_date
+        return self.__stat_item_date()
 
     @property
     def parent(self) -> str:
@@ -121,28 +148,22 @@ class FileEntry(EntryInterface):
     def calculate_md5(self) -> str:
         return eutes.hash_file(self.file_path, hashlib.md5())
 
-    def add_location_uri(self,
-                         document: Document,
-                         container: Element,
-                         entry_map: dict[str, EntryInterface],
-                         for_nli: bool) -> None:
+    def add_location_uri(self, writer: EDRMWriter, entry_map: dict[str, EntryInterface], for_nli: bool) -> None:
         """
         See edrm.EntryInterface.add_location_uri for details about this method.
 
         As the FileEntry will have an associated File object locating the document within the source file system, it
         will also provide a LocationURL placing that object in the Case.
         """
-        location_uri_element = document.createElement('LocationURI')
         if for_nli:
             location_uri = eutes.generate_relative_path(self, entry_map)
             location_uri = urllib.parse.quote_plus(location_uri, safe='/')
         else:
             location_uri = self.file_path.as_uri()
 
-        location_uri_element.appendChild(document.createTextNode(location_uri))
-        container.appendChild(location_uri_element)
+        writer.text_element('LocationURI', location_uri)
 
-    def add_file(self, document: Document, container: Element, entry_map: dict[str, EntryInterface], for_nli: bool):
+    def add_file(self, writer: EDRMWriter, entry_map: dict[str, EntryInterface], for_nli: bool):
         """
         See edrm.EntryInterface.add_file for details about this method.
 
@@ -150,16 +171,6 @@ class FileEntry(EntryInterface):
         it.  If the target of the EDRM load file is an NLI (for_nli=True), this method will use a relative path built
         from the parent entries for the file location.  Otherwise, it provides the full `file_path` property.
         """
-        files_list = document.createElement('Files')
-        container.appendChild(files_list)
-
-        file_element = document.createElement('File')
-        file_element.setAttribute('FileType', 'Native')
-        files_list.appendChild(file_element)
-
-        external_file = document.createElement('ExternalFile')
-        file_element.appendChild(external_file)
-
         if for_nli:
             from nuix_nli_lib.edrm import DirectoryEntry
             if self.parent is None or isinstance(self.parent, DirectoryEntry):
@@ -168,11 +179,16 @@ class FileEntry(EntryInterface):
                 relative_path = Path("natives") / self.name
 
             file_path = relative_path.parent if relative_path.parent != Path('') else ''
-            external_file.setAttribute('FilePath', str(file_path))
         else:
-            external_file.setAttribute('FilePath', str(self.file_path))
+            file_path = self.file_path
 
-        external_file.setAttribute('FileName', self.file_path.name)
         md5 = self.calculate_md5()
-        external_file.setAttribute('Hash', md5)
-        external_file.setAttribute('HashType', 'MD5')
+
+        writer.start_element('Files')
+        writer.start_element('File', {'FileType': 'Native'})
+        writer.empty_element('ExternalFile', {'FilePath': str(file_path),
+                                              'FileName': self.file_path.name,
+                                              'Hash': md5,
+                                              'HashType': 'MD5'})
+        writer.end_element()
+        writer.end_element()
@@ -4,9 +4,8 @@ import urllib
 from datetime import datetime
 from operator import contains
 from typing import Any, Union
-from xml.dom.minidom import Document, Element
 
-from nuix_nli_lib.edrm import FieldFactory, EntryField, EntryInterface, EDRMUtilities as eutes
+from nuix_nli_lib.edrm import FieldFactory, EntryField, EntryInterface, EDRMWriter, EDRMUtilities as eutes
 from nuix_nli_lib import edrm
 
 
@@ -215,11 +214,7 @@ class MappingEntry(EntryInterface):
     def calculate_md5(self) -> str:
         return eutes.hash_data(self.text, hashlib.md5())
 
-    def add_location_uri(self,
-                         document: Document,
-                         container: Element,
-                         entry_map: dict[str, EntryInterface],
-                         for_nli: bool):
+    def add_location_uri(self, writer: EDRMWriter, entry_map: dict[str, EntryInterface], for_nli: bool):
         """
         See edrm.EntryInterface.add_location_uri for details about the add_location_uri method.
 
@@ -229,33 +224,26 @@ class MappingEntry(EntryInterface):
         the NLI file and the location of that file is generated here.
         """
         if for_nli:
-            location_uri_element = document.createElement('LocationURI')
             location_uri = eutes.generate_relative_path(self, entry_map)
             location_uri = urllib.parse.quote_plus(location_uri, safe='/')
-            location_uri_element.appendChild(document.createTextNode(location_uri))
-            container.appendChild(location_uri_element)
+            writer.text_element('LocationURI', location_uri)
 
-    def serialize_content_file(self, document: Document, container: Element, entry_map: dict[str, EntryInterface]) -> None:
+    def serialize_content_file(self, writer: EDRMWriter, entry_map: dict[str, EntryInterface]) -> None:
         """
         When the target of the EDRM load file is to be used in an NLI file, the text contents of the MappingEntry will
         be stored as a native file in the container.  This method is responsible for writing the File XML element
         used to locate the native file in the container.  By default, the file will be written to a `natives` directory
         in the NLI file.
-        :param document: The DOM Document representing the EDRM load file
-        :param container: The DOM Element to add the File element to
+        :param writer: The writer for the EDRM load file, positioned inside the File element
         :return: None
         """
-        external_file = document.createElement('ExternalFile')
-        container.appendChild(external_file)
-
-        external_file.setAttribute('FilePath', 'natives')
-        external_file.setAttribute('FileName', str(self[self.identifier_field].value))
-
         md5 = self.calculate_md5()
-        external_file.setAttribute('Hash', md5)
-        external_file.setAttribute('HashType', 'MD5')
+        writer.empty_element('ExternalFile', {'FilePath': 'natives',
+                                              'FileName': str(self[self.identifier_field].value),
+                                              'Hash': md5,
+                                              'HashType': 'MD5'})
 
-    def add_file(self, document: Document, container: Element, entry_map: dict[str, EntryInterface], for_nli: bool):
+    def add_file(self, writer: EDRMWriter, entry_map: dict[str, EntryInterface], for_nli: bool):
         """
         See edrm.EntryInterface.add_file for details about the add_file method.
 
@@ -267,16 +255,13 @@ class MappingEntry(EntryInterface):
         if self.text is None or len(self.text) == 0:
             return
 
-        files_list = document.createElement('Files')
-        container.appendChild(files_list)
-
-        file_element = document.createElement('File')
-        file_element.setAttribute('FileType', 'Native' if for_nli else 'Text')
-        files_list.appendChild(file_element)
+        writer.start_element('Files')
+        writer.start_element('File', {'FileType': 'Native' if for_nli else 'Text'})
 
         if for_nli:
-            self.serialize_content_file(document, file_element, entry_map)
+            self.serialize_content_file(writer, entry_map)
         else:
-            inline_content = document.createElement('InlineContent')
-            file_element.appendChild(inline_content)
-            inline_content.appendChild(document.createTextNode(str(self.data)))
+            writer.text_element('InlineContent', str(self.data))
+
+        writer.end_element()
+        writer.end_element()
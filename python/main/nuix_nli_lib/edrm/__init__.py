@@ -1,5 +1,7 @@
 from nuix_nli_lib.edrm.EDRMUtilities import *
+from nuix_nli_lib.edrm.EDRMWriter import EDRMWriter
 from nuix_nli_lib.edrm.EntryField import EntryField
+from nuix_nli_lib.edrm.FieldRegistry import FieldRegistry
 from nuix_nli_lib.edrm.FieldFactory import *
 from nuix_nli_lib.edrm.EntryInterface import EntryInterface
 from nuix_nli_lib.edrm.FileEntry import FileEntry
@@ -11,6 +13,7 @@ configs = {
     'date_time_format': '%Y-%m-%dT%H:%M:%S.%f',
     'time_zone_format': '+00:00',
     'hash_buffer_size': 65536,
+    'write_buffer_size': 131072,
     'encoding': 'UTF-8',
     'custodian': 'Unknown',
     'default_itemdate_field': 'CreateTime',
@@ -34,6 +37,11 @@ hash_buffer_size:
 Integer representing the number of bytes to read per unit when generating hashes on files.  This value prevents run-away
 memory use when generating hashes on large files.
 
+write_buffer_size:
+Integer representing the number of bytes buffered before they are written out when saving the EDRM XML file or an NLI
+file.  The load file is written in many small pieces, so a buffer larger than the default keeps the number of writes to
+disk down.
+
 encoding:
 Encoding used to write the EDRM XML file with, as well as any other String output this tool puts to disk.
 
@@ -1,16 +1,156 @@
 import hashlib
-import platform
-import tempfile
+import io
+import posixpath
+import zipfile
 from datetime import datetime
 from pathlib import Path
-import shutil
-from typing import Any
-from xml.dom.minidom import getDOMImplementation, Document, Element
+from typing import Any, BinaryIO, Callable
+from xml.sax.saxutils import quoteattr
 
-from nuix_nli_lib import edrm, debug_log, configs as nli_configs
+from nuix_nli_lib import edrm, debug_log
 from nuix_nli_lib.edrm import DirectoryEntry, EDRMBuilder, EntryInterface, FileEntry, MappingEntry, EDRMUtilities as eutes
 
 
+_METADATA_PROPERTIES_BEFORE_DATETIME: tuple[tuple[str, str], ...] = (('case-number', '01'),)
+""" Properties written to every NLI's image_metadata.xml before its creation-datetime """
+
+_METADATA_PROPERTIES_AFTER_DATETIME: tuple[tuple[str, str], ...] = (
+    ('creation-software-name', 'Nuix Memory Analysis Tool'),
+    ('creation-software-version', '0.0.1'),
+    ('evidence-number', '01'),
+    ('examiner-name', 'Unknown'))
+""" Properties written to every NLI's image_metadata.xml after its creation-datetime """
+
+
+def _render_metadata_properties(properties: tuple[tuple[str, str], ...]) -> str:
+    """
+    Internal function that renders key / value pairs as the property elements of an NLI's image_metadata.xml.
+    """
+    return ''.join(f'        <property key={quoteattr(key)} value={quoteattr(value)}/>\n' for key, value in properties)
+
+
+_RENDERED_PROPERTIES_BEFORE_DATETIME: str = _render_metadata_properties(_METADATA_PROPERTIES_BEFORE_DATETIME)
+_RENDERED_PROPERTIES_AFTER_DATETIME: str = _render_metadata_properties(_METADATA_PROPERTIES_AFTER_DATETIME)
+""" The static properties rendered once, on either side of the creation-datetime """
+
+
+class _HashingWriter(io.RawIOBase):
+    """
+    Internal binary stream that passes everything written to it on to another stream, and updates a hash with it along
+    the way, so the hash of the output is known as soon as it has been written.
+    """
+
+    def __init__(self, output: BinaryIO, hash_function):
+        """
+        :param output: The stream to write to
+        :param hash_function: An initialized hashlib hash object to update with the written bytes
+        """
+        super().__init__()
+        self.__output = output
+        self.__hash = hash_function
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.__hash.update(data)
+        return self.__output.write(data)
+
+    def digest(self) -> bytes:
+        """
+        :return: The digest of everything written so far
+        """
+        return self.__hash.digest()
+
+
+class _ContainerWriter:
+    """
+    Internal class that places entries into an NLI container's zip archive: folders are added, files are read from disk
+    into the archive, and mapping text is written out.  Each entry is handled according to its type, through a table
+    keyed by the entry's exact type.  Entries of other types are matched to the handler of their nearest base class,
+    which is then cached for their type.
+    """
+
+    def __init__(self, nli_zip: zipfile.ZipFile, entry_map: dict[str, EntryInterface]):
+        """
+        :param nli_zip: The NLI container's archive
+        :param entry_map: The entries in the NLI, used to locate their parents
+        """
+        self.__nli_zip = nli_zip
+        self.__entry_map = entry_map
+        self.__encoding = edrm.configs['encoding']
+        self.__made_folders: set[str] = {''}
+
+    def add(self, entry: EntryInterface) -> None:
+        """
+        Place an entry into the NLI container.  Entries which have no representation in the container are ignored.
+        :param entry: The entry to add
+        :return: None
+        """
+        entry_type = type(entry)
+        try:
+            handler = _ContainerWriter._HANDLERS[entry_type]
+        except KeyError:
+            handler = next((_ContainerWriter._HANDLERS[base] for base in entry_type.__mro__
+                            if base in _ContainerWriter._HANDLERS),
+                           _ContainerWriter.__add_nothing)
+            _ContainerWriter._HANDLERS[entry_type] = handler
+
+        handler(self, entry)
+
+    def make_folder(self, folder: str) -> None:
+        """
+        Add a folder, and any of its parents, to the archive unless it has already been added.  Each folder is added
+        once, when the first entry is placed in it, so folders always come before their contents in the archive.
+        :param folder: The folder's name in the archive, without a trailing '/'
+        :return: None
+        """
+        missing_folders = []
+        while folder not in self.__made_folders:
+            missing_folders.append(folder)
+            folder = posixpath.dirname(folder)
+
+        for missing_folder in reversed(missing_folders):
+            self.__nli_zip.mkdir(missing_folder)
+            self.__made_folders.add(missing_folder)
+
+    def __archive_name(self, entry: FileEntry) -> str:
+        parent = entry.parent
+        if parent is None or isinstance(parent, DirectoryEntry):
+            archive_name = eutes.generate_relative_path(entry, self.__entry_map)
+        else:
+            archive_name = f'natives/{entry.name}'
+        debug_log(f"\tArchive Path {archive_name}", flush=True)
+        return archive_name
+
+    def __add_file(self, entry: FileEntry) -> None:
+        archive_name = self.__archive_name(entry)
+        self.make_folder(posixpath.dirname(archive_name))
+        self.__nli_zip.write(entry.file_path, archive_name)
+
+    def __add_directory(self, entry: DirectoryEntry) -> None:
+        self.make_folder(self.__archive_name(entry))
+
+    def __add_mapping(self, entry: MappingEntry) -> None:
+        text = entry.text
+        if text is not None:
+            # More likely than files to cause name collisions.  Use ID as the file name
+            archive_name = f'natives/{entry.identifier}'
+            self.make_folder('natives')
+
+            debug_log(f"\tArchive Path {archive_name}", flush=True)
+            self.__nli_zip.writestr(archive_name, text.encode(self.__encoding))
+
+    def __add_nothing(self, entry: EntryInterface) -> None:
+        return
+
+    _HANDLERS: dict[type, Callable[['_ContainerWriter', EntryInterface], None]] = {
+        FileEntry: __add_file,
+        DirectoryEntry: __add_directory,
+        MappingEntry: __add_mapping,
+    }
+
+
 class NLIGenerator(object):
     """
     Factory for building Nuix Logical Images (NLI).  This class primarily acts as wrapper around an `edrm.EDRMBuilder`
@@ -40,10 +180,20 @@ class NLIGenerator(object):
              |- doc3.txt
     </pre>
     """
-    def __init__(self):
+    def __init__(self, reuse_load_file: bool = False):
+        """
+        :param reuse_load_file: When True, the EDRM XML load file is kept in memory after each save, and used again by
+                                the next save if no entries have changed in between.  Otherwise the load file is
+                                written straight into the NLI container on every save.
+        """
         self.__edrm_builder = EDRMBuilder()
         self.__edrm_builder.as_nli = True
 
+        self.__reuse_load_file = reuse_load_file
+        self.__state_signature: bytes | None = None
+        self.__load_file_data: bytes | None = None
+        self.__load_file_hash: bytes | None = None
+
     def add_entry(self, entry: EntryInterface) -> str:
         """
         Wrapper around `edrm.EDRMBuilder.add_entry()` to add a generic entry to the NLI container.  This method will
@@ -77,120 +227,94 @@ class NLIGenerator(object):
 
     def generate_metadata_file(self, metadata_path: Path):
         """
-        Generate the content_metadata.xml file for the NLI container and stores it in the provided metadata_path.
+        Generate the image_metadata.xml file for the NLI container and stores it in the provided metadata_path.
         :param metadata_path: The ._metadata path for the NLI container, used to store the metadata file.
         :return: None
         """
-        metadata_file: Document = getDOMImplementation().createDocument(None, "image-metadata", None)
-        property_list: Element = metadata_file.createElement('properties')
-
-        case_element: Element = metadata_file.createElement('property')
-        case_element.setAttribute("key", "case-number")
-        case_element.setAttribute("value", "01")
-        property_list.appendChild(case_element)
-
-        datetime_element: Element = metadata_file.createElement('property')
-        datetime_element.setAttribute("key", "creation-datetime")
-        datetime_element.setAttribute("value", datetime.now().strftime('%Y/%m/%d %H:%M:%S.%f')[:-3] + " UTC")
-        property_list.appendChild(datetime_element)
-
-        sw_element: Element = metadata_file.createElement('property')
-        sw_element.setAttribute("key", "creation-software-name")
-        sw_element.setAttribute("value", "Nuix Memory Analysis Tool")
-        property_list.appendChild(sw_element)
-
-        swv_element: Element = metadata_file.createElement('property')
-        swv_element.setAttribute("key", "creation-software-version")
-        swv_element.setAttribute("value", "0.0.1")
-        property_list.appendChild(swv_element)
-
-        evidence_element: Element = metadata_file.createElement('property')
-        evidence_element.setAttribute("key", "evidence-number")
-        evidence_element.setAttribute("value", "01")
-        property_list.appendChild(evidence_element)
-
-        examiner_element: Element = metadata_file.createElement('property')
-        examiner_element.setAttribute("key", "examiner-name")
-        examiner_element.setAttribute("value", "Unknown")
-        property_list.appendChild(examiner_element)
+        metadata_file_path: Path = metadata_path / 'image_metadata.xml'
+        metadata_file_path.write_text(self.__build_metadata_xml(), encoding=edrm.configs['encoding'])
 
-        metadata_file.documentElement.appendChild(property_list)
+    def __build_metadata_xml(self) -> str:
+        """
+        Internal method that produces the contents of the image_metadata.xml file for the NLI container.
+        """
+        creation_datetime = datetime.now().strftime('%Y/%m/%d %H:%M:%S.%f')[:-3] + " UTC"
+        datetime_property = _render_metadata_properties((('creation-datetime', creation_datetime),))
+        encoding = edrm.configs['encoding']
 
-        metadata_file_path: Path = metadata_path / 'image_metadata.xml'
-        with metadata_file_path.open(mode='w', encoding=edrm.configs['encoding']) as metadata_xml:
-            metadata_file.writexml(metadata_xml, encoding=edrm.configs['encoding'], addindent='    ', newl='\n')
+        metadata_xml = (f'<?xml version="1.0" encoding="{encoding}"?>\n'
+                        f'<image-metadata>\n'
+                        f'    <properties>\n'
+                        f'{_RENDERED_PROPERTIES_BEFORE_DATETIME}'
+                        f'{datetime_property}'
+                        f'{_RENDERED_PROPERTIES_AFTER_DATETIME}'
+                        f'    </properties>\n'
+                        f'</image-metadata>\n')
+        return metadata_xml
 
     def save(self, file_path: Path):
         """
         Build and save the NLI container to the provided file_path.
 
-        This method will trigger the build process, which will build the underlying EDRM XML load file, copy contents
-        to the NLI container, package the container, and store it to the file_path provided.
+        This method will trigger the build process, which will build the underlying EDRM XML load file and package it,
+        the NLI metadata, and the entries' contents into the NLI container at the file_path provided.  Everything is
+        written directly into the container, rather than staged on disk first.
         :param file_path: Path to the location the NLI file should be saved, including the file name and extension
         :return: None
         """
 
-        do_delete = not nli_configs['debug'] if 'debug' in nli_configs else True
-        with tempfile.TemporaryDirectory() if do_delete else tempfile.mkdtemp() as temp_loc:
-            temp_path = Path(temp_loc)
-            build_path = temp_path / 'NLI_Gen'
-            metadata_path = build_path / '._metadata'
-            debug_log(f"Using {build_path} for temp storage")
-            debug_log(f"Using {metadata_path} for the metadata storage", flush=True)
-            metadata_path.mkdir(parents=True, exist_ok=True)
-            debug_log(f"{metadata_path} created")
-
-            # Make the EDRM XML 1.2 file
-            self.__edrm_builder.output_path = metadata_path / 'image_contents.xml'
-            debug_log(f"Using {self.__edrm_builder.output_path} for the EDRM XML", flush=True)
-            self.__edrm_builder.save()
-            debug_log(f"{self.__edrm_builder.output_path} created", flush=True)
-
-            # Copy files and folders to their temp location
-            entry_map = self.__edrm_builder.entry_map
-            for entry in self.__edrm_builder.entry_map.values():
-                debug_log(f"Copying {entry.name} to {build_path}", flush=True)
-                if isinstance(entry, FileEntry):
-                    if entry.parent is None or isinstance(entry.parent, DirectoryEntry):
-                        relative_path = eutes.generate_relative_path(entry, entry_map)
-                    else:
-                        relative_path = Path("natives") / entry.name
-                    debug_log(f"\tTemp Path {build_path / relative_path}", flush=True)
-                    destination_path = build_path / relative_path
-
-                    if destination_path.parent is not None:
-                        destination_path.parent.mkdir(parents=True, exist_ok=True)
-
-                    if isinstance(entry, DirectoryEntry):
-                        destination_path.mkdir(exist_ok=True)
-                    else:
-                        shutil.copy2(entry.file_path, destination_path)
-                elif isinstance(entry, MappingEntry):
-                    if entry.text is not None:
-                        # More likely than files to cause name collisions.  Use ID as the file name
-                        mapping_path = build_path / "natives" / entry[entry.identifier_field].value
-                        mapping_path.parent.mkdir(parents=True, exist_ok=True)
-                        if platform.system() == 'Windows':
-                            mapping_path = Path(f'\\\\?\\{mapping_path}')
-
-                        debug_log(f"\tTemp Path {mapping_path}", flush=True)
-                        with mapping_path.open(mode='w', encoding=edrm.configs['encoding']) as map_file:
-                            map_file.write(entry.text)
-
-            # make the .metadata/image_metadata.xml file
-            self.generate_metadata_file(metadata_path)
-
-            # make the .metadata/image_contents.sha1_hash file
-            metadata_hash = edrm.EDRMUtilities.hash_file(self.__edrm_builder.output_path,
-                                                         hashlib.sha1(),
-                                                         as_string=False)
-            metadata_hash_path = metadata_path / 'image_contents.sha1_hash'
-            with metadata_hash_path.open(mode='wb') as metadata_hash_file:
-                metadata_hash_file.write(metadata_hash)
-
-            # Zip the contents
-            temp_nli_path = temp_path / f'{file_path.stem}'
-            shutil.make_archive(str(temp_nli_path), 'zip', root_dir=build_path)
-
-            # Copy to file_path
-            shutil.copy(f'{temp_nli_path}.zip', str(file_path))
+        # Write the zip next to file_path, then move the finished zip into place.  The move is a rename on the same
+        # file system, and file_path is never left holding a partially written NLI.
+        partial_path = file_path.with_name(f'{file_path.name}.part')
+        debug_log(f"Writing the NLI to {partial_path}", flush=True)
+        try:
+            with (partial_path.open(mode='wb', buffering=edrm.configs['write_buffer_size']) as nli_file,
+                  zipfile.ZipFile(nli_file, 'w', compression=zipfile.ZIP_STORED, allowZip64=True) as nli_zip):
+                self.__write_archive(nli_zip)
+            partial_path.replace(file_path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
+        debug_log(f"{file_path} created", flush=True)
+
+    def __write_load_file(self, output: BinaryIO) -> bytes:
+        """
+        Internal method that writes the EDRM XML load file to `output` and returns its SHA-1 hash.  The XML is hashed as
+        it is serialized, rather than read back and hashed once it is complete.
+        """
+        hashing_writer = _HashingWriter(output, hashlib.sha1())
+        buffered_writer = io.BufferedWriter(hashing_writer, buffer_size=edrm.configs['write_buffer_size'])
+        with io.TextIOWrapper(buffered_writer, encoding=edrm.configs['encoding']) as load_file:
+            self.__edrm_builder.write(load_file)
+        return hashing_writer.digest()
+
+    def __write_archive(self, nli_zip: zipfile.ZipFile) -> None:
+        """
+        Internal method that writes the NLI container's metadata and contents into its zip archive.
+        """
+        # Add the ._metadata folder: the EDRM XML 1.2 file, its hash, and the image_metadata.xml file
+        nli_zip.mkdir('._metadata')
+        with nli_zip.open('._metadata/image_contents.xml', mode='w', force_zip64=True) as load_file_data:
+            if not self.__reuse_load_file:
+                load_file_hash = self.__write_load_file(load_file_data)
+            else:
+                state_signature = self.__edrm_builder.state_signature()
+                if state_signature == self.__state_signature:
+                    debug_log("No changes since the last save, reusing its EDRM XML", flush=True)
+                else:
+                    kept_load_file = io.BytesIO()
+                    self.__load_file_hash = self.__write_load_file(kept_load_file)
+                    self.__load_file_data = kept_load_file.getvalue()
+                    self.__state_signature = state_signature
+
+                load_file_data.write(self.__load_file_data)
+                load_file_hash = self.__load_file_hash
+        nli_zip.writestr('._metadata/image_contents.sha1_hash', load_file_hash)
+        nli_zip.writestr('._metadata/image_metadata.xml', self.__build_metadata_xml().encode(edrm.configs['encoding']))
+
+        # Add the entries' folders, files, and mapping text.  Files are read from their source straight into the zip.
+        entry_map = self.__edrm_builder.entry_map
+        add_to_container = _ContainerWriter(nli_zip, entry_map).add
+        for entry in entry_map.values():
+            debug_log(f"Adding {entry.name} to the NLI", flush=True)
+            add_to_container(entry)
@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 from datetime import datetime
 
@@ -9,32 +10,35 @@ from nuix_nli_lib.edrm import EntryInterface, FileEntry, DirectoryEntry, Mapping
 from nuix_nli_lib.data_types import CSVEntry, CSVRowEntry, JSONValueEntry, JSONArrayEntry, JSONObjectEntry, JSONFileEntry
 from nuix_nli_lib.nli import NLIGenerator
 
-print("                                                                                                           \n" +
-      "                                                                                                           \n" +
-      "                                                                                                           \n" +
-      "     #########      ###**###                                                                               \n" +
-      "   #*#*######**###***######***#                                                                            \n" +
-      " #**##**#****###*####*******####                                                                           \n" +
-      " **##**#**#########*##*#**#**##*#                                                                          \n" +
-      "#**#*#***##*###**#*##**###*#*##*##    ##**#####*****###    ##****        *****#  ##*### ##**#        ##*## \n" +
-      "#*#**#**#   #######*##  ##*#**####   #****************##  #*****#       ##***** #*****# #*****#    ##****#*\n" +
-      " #*#*#*#**#  #**##*#*  ##*##**#*#    #*******#####******# #*****#       #*****# #******  #*****#  #******# \n" +
-      " #####*###### ##***  #*###*#*##*     #******#      ******##*****#       #*****# #******   ##****##*****#   \n" +
-      "   #*##**#***#  ## ###*##*##**#      #*****#       *****#*#*****#       #*****# #******     #********##    \n" +
-      "    #**##**##**   ***##**##**#       #*****#       ##*****#*****#       #*****# #******      ##*****#      \n" +
-      "   ***######**     #####*#*#**#      #*****#       ##*****#*****#       #*****# #******     #********#     \n" +
-      " #**##**##**# ##**#  #*##*###*##     #*****#       ##*****##****##      #*****# #******   ##***********#   \n" +
-      "#*###*##**#  #**##*#   ####**##*#    #*****#       ##***** #*****### ##*#*****# #******  #******# *#****#  \n" +
-      "#*##*#####  #####*#*##  #**##*##*#   #*****#       ##*****  ##**********#*****# #****** ##****#    #*****##\n" +
-      "#*#**##*# #####*#*#*##*  #**#**#*#    #*****       #*****#   ###********#****## #****## ****##       ****##\n" +
-      "**##*###**#*###* #**###**###**####     ###           ###        ##*###    ####    ###    ###          ##*  \n" +
-      " ##*###*####*###**##**#*****#####                                                                          \n" +
-      "  #**####*####**#*#*##*#*###**##                                                                           \n" +
-      "    ##*#***#*##    ##*****#*##                                                                             \n" +
-      "                                                                                                           \n" +
-      "                                                                                                           \n" +
-      "Nuix Logical Image Builder: the nuix_nli_lib packages and its children are available.  Start with:         \n" +
-      " --------------------------                                                                                \n" +
-      " |  nli = NLIGenerator()  |                                                                                \n" +
-      " --------------------------                                                                                "
-)
+_BANNER = """\
+                                                                                                           
+                                                                                                           
+                                                                                                           
+     #########      ###**###                                                                               
+   #*#*######**###***######***#                                                                            
+ #**##**#****###*####*******####                                                                           
+ **##**#**#########*##*#**#**##*#                                                                          
+#**#*#***##*###**#*##**###*#*##*##    ##**#####*****###    ##****        *****#  ##*### ##**#        ##*## 
+#*#**#**#   #######*##  ##*#**####   #****************##  #*****#       ##***** #*****# #*****#    ##****#*
+ #*#*#*#**#  #**##*#*  ##*##**#*#    #*******#####******# #*****#       #*****# #******  #*****#  #******# 
+ #####*###### ##***  #*###*#*##*     #******#      ******##*****#       #*****# #******   ##****##*****#   
+   #*##**#***#  ## ###*##*##**#      #*****#       *****#*#*****#       #*****# #******     #********##    
+    #**##**##**   ***##**##**#       #*****#       ##*****#*****#       #*****# #******      ##*****#      
+   ***######**     #####*#*#**#      #*****#       ##*****#*****#       #*****# #******     #********#     
+ #**##**##**# ##**#  #*##*###*##     #*****#       ##*****##****##      #*****# #******   ##***********#   
+#*###*##**#  #**##*#   ####**##*#    #*****#       ##***** #*****### ##*#*****# #******  #******# *#****#  
+#*##*#####  #####*#*##  #**##*##*#   #*****#       ##*****  ##**********#*****# #****** ##****#    #*****##
+#*#**##*# #####*#*#*##*  #**#**#*#    #*****       #*****#   ###********#****## #****## ****##       ****##
+**##*###**#*###* #**###**###**####     ###           ###        ##*###    ####    ###    ###          ##*  
+ ##*###*####*###**##**#*****#####                                                                          
+  #**####*####**#*#*##*#*###**##                                                                           
+    ##*#***#*##    ##*****#*##                                                                             
+                                                                                                           
+                                                                                                           
+Nuix Logical Image Builder: the nuix_nli_lib packages and its children are available.  Start with:         
+ --------------------------                                                                                
+ |  nli = NLIGenerator()  |                                                                                
+ --------------------------                                                                                
+"""
+
+sys.stdout.write(_BANNER)
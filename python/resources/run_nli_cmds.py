@@ -19,37 +19,44 @@ def build_args():
     return parser.parse_args()
 
 def add_lib_to_path(lib_path: str):
-    if not Path.exists(Path(lib_path)):
+    if not Path(lib_path).exists():
         raise ValueError("The nuix_nli_lib.zip path does not exist")
 
     print("NLI Library:", lib_path)
     sys.path.append(lib_path)
 
 def check_evidence(evidence: str):
-    if not Path.exists(Path(evidence)):
+    if not Path(evidence).exists():
         raise ValueError("The evidence path does not exist")
 
     print("Evidence:", evidence)
 
 def check_output(output: str):
     output_path = Path(output)
-    output_exists = output_path.exists() if output_path.is_dir() else output_path.parent.exists()
+    output_exists = output_path.is_dir() or output_path.parent.exists()
 
     if not output_exists:
         raise ValueError("The output path does not exist")
 
     print("Output:", output)
 
+def run_script(script_path: str):
+    with open(script_path, 'rb') as script_file:
+        source = script_file.read()
+
+    # Compiling with the script's path makes errors in the script report where they came from
+    exec(compile(source, script_path, 'exec'), globals())
+
 
 if __name__ == "__main__":
     app_args = build_args()
     add_lib_to_path(app_args.nli_lib_zip)
 
     generator_path = app_args.row_generator
-    if not Path.exists(Path(generator_path)):
+    if not Path(generator_path).exists():
         raise ValueError("The row generator path does not exist")
     print("Row Generator:", generator_path)
-    exec(open(generator_path).read(), globals(), locals())
+    run_script(generator_path)
 
     evidence_path = app_args.evidence
     output_file_path = app_args.output
@@ -58,10 +65,10 @@ if __name__ == "__main__":
     check_output(output_file_path)
 
     processor_path = app_args.evidence_processor
-    if not Path.exists(Path(processor_path)):
+    if not Path(processor_path).exists():
         raise ValueError("The evidence processor path does not exist")
     print("Evidence Processor:", processor_path)
-    exec(open(processor_path).read(), globals(), locals())
+    run_script(processor_path)
 
 
 
@@ -1,11 +1,21 @@
 from pathlib import Path
 import unittest
 from datetime import datetime
+from functools import cached_property
 from typing import Union
 
-from nuix_nli_lib.edrm import EDRMBuilder
+from nuix_nli_lib.edrm import EDRMBuilder, FileEntry
 from nuix_nli_lib.data_types import CSVEntry, CSVRowEntry
 
+ENVARS: str = r'\\innovation.nuix.com\SharedFolder\Koblenz\data\envars.csv'
+PSLIST: str = r'\\innovation.nuix.com\SharedFolder\Koblenz\data\pslist.csv'
+MINPS: str = r'C:\projects\proserv\Koblenz\NuixMemoryAnalysis\running\physmem.raw\windows.pslist.MinPsList.csv'
+MEMORY: str = r'C:\projects\proserv\Koblenz\example.ps1'
+OUTPUT_PATH: Path = Path(r'C:\projects\proserv\Koblenz\output')
+
+HOST_DATA_AVAILABLE: bool = all(Path(path).exists() for path in (ENVARS, PSLIST, MEMORY, OUTPUT_PATH))
+""" These tests read their data from, and write to, locations that only exist on the original development hosts """
+
 
 class ProcessEntry(CSVRowEntry):
     """
@@ -17,10 +27,22 @@ class ProcessEntry(CSVRowEntry):
     """
     def __init__(self, parent_csv: CSVEntry, row_index: int):
         ppid = parent_csv.data[row_index]['PPID']
-        known_ppid = len([row for row in parent_csv.data if row['PID'] == ppid]) > 0
+        known_ppid = ppid in ProcessEntry.known_pids(parent_csv)
 
         super().__init__(parent_csv, row_index, parent_id=ppid if known_ppid else None)
 
+    @staticmethod
+    def known_pids(parent_csv: CSVEntry) -> frozenset[str]:
+        """
+        The PIDs of all the rows in the CSV file.  These are collected once per file and kept on the CSVEntry, so
+        looking up each row's parent does not scan every row of the file.
+        """
+        known_pids = getattr(parent_csv, '_pid_index', None)
+        if known_pids is None:
+            known_pids = frozenset(row['PID'] for row in parent_csv.data)
+            parent_csv._pid_index = known_pids
+        return known_pids
+
     @property
     def identifier_field(self) -> str:
         """
@@ -49,7 +71,7 @@ class ProcessEntry(CSVRowEntry):
         """
         Again, not technically required, as it matches the default behavior, but specified for completeness.
         """
-        return datetime.strptime(self['CreateTime'].value.strip(), '%Y-%m-%d %H:%M:%S.%f')
+        return datetime.fromisoformat(self['CreateTime'].value.strip())
 
     @property
     def text(self) -> Union[str, None]:
@@ -77,34 +99,40 @@ class EnvEntry(CSVRowEntry):
     def get_name(self) -> str:
         return f'({self['PID'].value}) {self['Process'].value} [{self['Variable'].value}]'
 
-    @property
+    @cached_property
     def text(self) -> Union[str, None]:
         return f'({self['Variable'].value})={self['Value'].value}'
 
 
+@unittest.skipUnless(HOST_DATA_AVAILABLE, 'CSV test data is not available on this host')
 class CSVTests(unittest.TestCase):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.envars: str = r'\\innovation.nuix.com\SharedFolder\Koblenz\data\envars.csv'
-        self.pslist: str = r'\\innovation.nuix.com\SharedFolder\Koblenz\data\pslist.csv'
-        self.minps: str = r'C:\projects\proserv\Koblenz\NuixMemoryAnalysis\running\physmem.raw\windows.pslist.MinPsList.csv'
-        self.memory: str = r'C:\projects\proserv\Koblenz\example.ps1'
-        self.output_path: Path = Path(r'C:\projects\proserv\Koblenz\output')
+    envars: str = ENVARS
+    pslist: str = PSLIST
+    minps: str = MINPS
+    memory: str = MEMORY
+    output_path: Path = OUTPUT_PATH
+
+    @classmethod
+    def setUpClass(cls):
+        # Each CSV is parsed once and its entry shared by the tests that load it the same way.  The entries are only
+        # read when they are added to a builder, so sharing them does not couple the tests.
+        cls.envars_entry = CSVEntry(cls.envars)
+        cls.process_entry = CSVEntry(cls.pslist, row_generator=ProcessEntry)
+        cls.memory_entry = FileEntry(cls.memory, 'application/octet-stream')
+        cls.minprocess_entry = CSVEntry(cls.pslist, row_generator=ProcessEntry, parent_id=cls.memory_entry.identifier)
 
     def test_base_csv(self):
-        entry = CSVEntry(self.envars)
         builder = EDRMBuilder()
         builder.as_nli = False
         builder.output_path = self.output_path / 'csv_test.xml'
-        entry.add_to_builder(builder)
+        self.envars_entry.add_to_builder(builder)
         builder.save()
 
     def test_nli_csv(self):
-        entry = CSVEntry(self.envars)
         builder = EDRMBuilder()
         builder.as_nli = True
         builder.output_path = self.output_path / 'csv_nli_test.xml'
-        entry.add_to_builder(builder)
+        self.envars_entry.add_to_builder(builder)
         builder.save()
 
     def test_generator_csv(self):
@@ -119,32 +147,28 @@ class CSVTests(unittest.TestCase):
         builder = EDRMBuilder()
         builder.as_nli = False
         builder.output_path = self.output_path / 'process_test.xml'
-        entry = CSVEntry(self.pslist, row_generator=ProcessEntry)
-        entry.add_to_builder(builder)
+        self.process_entry.add_to_builder(builder)
         builder.save()
 
     def test_process_csv_nli(self):
         builder = EDRMBuilder()
         builder.as_nli = True
         builder.output_path = self.output_path / 'process_nli_test.xml'
-        entry = CSVEntry(self.pslist, row_generator=ProcessEntry)
-        entry.add_to_builder(builder)
+        self.process_entry.add_to_builder(builder)
         builder.save()
 
     def test_minprocess_csv(self):
         builder = EDRMBuilder()
         builder.as_nli = False
         builder.output_path = self.output_path / 'minprocess_test.xml'
-        mem_id = builder.add_file(self.memory, 'application/octet-stream')
-        entry = CSVEntry(self.pslist, row_generator=ProcessEntry, parent_id=mem_id)
-        entry.add_to_builder(builder)
+        builder.add_entry(self.memory_entry)
+        self.minprocess_entry.add_to_builder(builder)
         builder.save()
 
     def test_minprocess_csv_nli(self):
         builder = EDRMBuilder()
         builder.as_nli = True
         builder.output_path = self.output_path / 'minprocess_nli_test.xml'
-        mem_id = builder.add_file(self.memory, 'application/octet-stream')
-        entry = CSVEntry(self.pslist, row_generator=ProcessEntry, parent_id=mem_id)
-        entry.add_to_builder(builder)
+        builder.add_entry(self.memory_entry)
+        self.minprocess_entry.add_to_builder(builder)
         builder.save()
@@ -1,17 +1,25 @@
+import io
+from datetime import datetime
 from pathlib import Path
 import unittest
 from typing import Any
 
-from nuix_nli_lib.edrm import DirectoryEntry, EDRMBuilder, FileEntry, MappingEntry
+from nuix_nli_lib.edrm import DirectoryEntry, EDRMBuilder, EDRMWriter, EntryField, FieldRegistry, FileEntry, MappingEntry
+from nuix_nli_lib.edrm import EDRMUtilities as eutes
+
+RESOURCES: Path = (Path(__file__).parent / 'resources').resolve()
+SAMPLE_DIRECTORY: str = str(RESOURCES / 'certificates')
+SAMPLE_FILE: str = str(RESOURCES / 'top-level-MD5-digests.txt')
+OUTPUT_PATH: Path = RESOURCES / 'output'
 
 
 class TestEDRM(unittest.TestCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.sample_directory: str = str(Path(".", "resources", "certificates").absolute())
-        self.sample_file: str = str(Path(".", "resources", "top-level-MD5-digests.txt").absolute())
+        self.sample_directory: str = SAMPLE_DIRECTORY
+        self.sample_file: str = SAMPLE_FILE
         self.sample_mapping: dict[str, Any] = {'a': 1, 'b': 2}
-        self.output_path: Path = Path(".", "resources", "output").absolute()
+        self.output_path: Path = OUTPUT_PATH
 
     def test_simple_file(self):
         file_entry = FileEntry(self.sample_file, "plain/text")
@@ -110,3 +118,170 @@ class TestEDRM(unittest.TestCase):
         file_id = builder.add_file(self.sample_file, "application/powershell_script", parent_id=folder_id)
         map_id = builder.add_mapping(self.sample_mapping, "application/x-database-table-row", parent_id=file_id)
         builder.save()
+
+    def test_build_document(self):
+        builder = EDRMBuilder()
+        builder.as_nli = False
+        file_id = builder.add_file(self.sample_file, "application/powershell_script")
+        builder.add_mapping(self.sample_mapping, "application/x-database-table-row", parent_id=file_id)
+        document = builder.build()
+
+        self.assertEqual('Root', document.documentElement.tagName)
+        documents = document.getElementsByTagName('Documents')[0]
+        self.assertEqual(2, len(documents.getElementsByTagName('Document')))
+        for field_values in document.getElementsByTagName('FieldValues'):
+            self.assertTrue(field_values.getElementsByTagName('field_0'))
+
+    def test_add_entries(self):
+        builder = EDRMBuilder()
+        builder.as_nli = False
+        file_id = builder.add_file(self.sample_file, "application/powershell_script")
+        entries = [MappingEntry({'name': f'row {index}', 'value': index}, "application/x-database-table-row",
+                                parent_id=file_id)
+                   for index in range(3)]
+        entry_ids = builder.add_entries(iter(entries))
+
+        self.assertEqual([entry.identifier for entry in entries], entry_ids)
+        self.assertEqual([file_id] + entry_ids, list(builder.entry_map.keys()))
+
+        document = builder.build()
+        relationships = document.getElementsByTagName('Relationship')
+        self.assertEqual(entry_ids, [relationship.getAttribute('ChildDocId') for relationship in relationships])
+
+    def test_identifier_follows_field(self):
+        entry = MappingEntry(self.sample_mapping, "application/x-database-table-row")
+        self.assertEqual(entry['SHA-1'].value, entry.identifier)
+
+        entry['SHA-1'].value = 'changed through the field'
+        self.assertEqual('changed through the field', entry.identifier)
+
+        entry.set_field_value('SHA-1', 'changed through the entry')
+        self.assertEqual('changed through the entry', entry.identifier)
+
+        entry['SHA-1'] = EntryField('sha1_key', 'SHA-1', EntryField.TYPE_TEXT, 'replaced field')
+        self.assertEqual('replaced field', entry.identifier)
+
+    def test_relative_path_prefixes(self):
+        builder = EDRMBuilder()
+        parent_id = builder.add_mapping({'Name': 'parent'}, "application/x-database-table-row")
+        child_id = builder.add_mapping({'Name': 'child'}, "application/x-database-table-row", parent_id=parent_id)
+        entry_map = builder.entry_map
+        self.assertEqual('parent/child', eutes.generate_relative_path(entry_map[child_id], entry_map))
+
+        entry_map[parent_id].data['Name'] = 'renamed'
+        self.assertEqual('parent/child', eutes.generate_relative_path(entry_map[child_id], entry_map))
+        eutes.invalidate_path_prefixes()
+        self.assertEqual('renamed/child', eutes.generate_relative_path(entry_map[child_id], entry_map))
+
+
+class TestLazyFields(unittest.TestCase):
+    def setUp(self):
+        self.entry = MappingEntry({'a': 1, 'b': 2}, "application/x-database-table-row")
+        self.build_count = 0
+
+    def build_field(self) -> EntryField:
+        self.build_count += 1
+        return EntryField('lazy_key', 'Lazy', EntryField.TYPE_TEXT, 'built')
+
+    def test_built_on_access(self):
+        self.entry.add_lazy_field('Lazy', self.build_field)
+        self.assertEqual(0, self.build_count)
+
+        self.assertEqual('built', self.entry['Lazy'].value)
+        self.assertEqual('built', self.entry['Lazy'].value)
+        self.assertEqual(1, self.build_count)
+
+    def test_built_on_iteration_in_place(self):
+        field_names = [field_name for field_name, _ in self.entry]
+        self.entry.add_lazy_field('Lazy', self.build_field)
+        self.entry['Eager'] = EntryField('eager_key', 'Eager', EntryField.TYPE_TEXT, 'eager')
+
+        fields = dict(self.entry)
+        self.assertEqual(field_names + ['Lazy', 'Eager'], list(fields))
+        self.assertEqual('built', fields['Lazy'].value)
+        list(self.entry)
+        self.assertEqual(1, self.build_count)
+
+    def test_set_value_before_access(self):
+        self.entry.add_lazy_field('Lazy', self.build_field)
+        self.entry.set_field_value('Lazy', 'changed')
+        self.assertEqual(1, self.build_count)
+        self.assertEqual('changed', self.entry['Lazy'].value)
+
+    def test_replaced_before_access(self):
+        self.entry.add_lazy_field('Lazy', self.build_field)
+        self.entry['Lazy'] = EntryField('lazy_key', 'Lazy', EntryField.TYPE_TEXT, 'replaced')
+        self.assertEqual('replaced', dict(self.entry)['Lazy'].value)
+        self.assertEqual(0, self.build_count)
+
+    def test_item_date_from_stat(self):
+        class DatedFileEntry(FileEntry):
+            @property
+            def itemdate(self) -> datetime:
+                return datetime(2000, 1, 1)
+
+        expected = FileEntry(SAMPLE_FILE, "plain/text")['Item Date'].value
+        self.assertEqual(expected, DatedFileEntry(SAMPLE_FILE, "plain/text")['Item Date'].value)
+
+
+class TestFieldRegistry(unittest.TestCase):
+    def test_key_for(self):
+        registry = FieldRegistry()
+        self.assertNotIn('Name', registry)
+        self.assertEqual('field_0', registry.key_for('Name'))
+        self.assertEqual('field_1', registry.key_for('Size'))
+        self.assertEqual('field_0', registry.key_for('Name'))
+        self.assertIn('Name', registry)
+        self.assertEqual({'Name': 'field_0', 'Size': 'field_1'}, registry.name_key_map)
+
+    def test_registries_are_independent(self):
+        first_registry = FieldRegistry()
+        first_registry.key_for('Name')
+        second_registry = FieldRegistry()
+        self.assertEqual('field_0', second_registry.key_for('Size'))
+        self.assertNotIn('Size', first_registry)
+
+    def test_keys_numbered_per_build(self):
+        def field_keys(builder: EDRMBuilder) -> dict[str, str]:
+            document = builder.build()
+            return {field.getAttribute('Name'): field.getAttribute('Key')
+                    for field in document.getElementsByTagName('Field')}
+
+        first_builder = EDRMBuilder()
+        first_builder.add_mapping({'a': 1}, "application/x-database-table-row")
+        second_builder = EDRMBuilder()
+        second_builder.add_mapping({'b': 2}, "application/x-database-table-row")
+
+        first_keys = field_keys(first_builder)
+        self.assertEqual([f'field_{index}' for index in range(len(first_keys))], list(first_keys.values()))
+        self.assertEqual(first_keys, field_keys(first_builder))
+        self.assertEqual('field_0', field_keys(second_builder)['b'])
+
+
+class UpperCaseField(EntryField):
+    def serialize_value(self, writer: EDRMWriter, key: str = None) -> None:
+        writer.text_element(key or self.key, str(self.value).upper())
+
+
+class TestFieldValues(unittest.TestCase):
+    @staticmethod
+    def serialize(entry: MappingEntry) -> str:
+        output = io.StringIO()
+        writer = EDRMWriter(output, 'UTF-8', addindent='', newl='')
+        writer.start_element('FieldValues')
+        entry.serialize_field_values(writer, FieldRegistry())
+        writer.end_element()
+        return output.getvalue()
+
+    def test_field_values(self):
+        entry = MappingEntry({'Note': 'a<b', 'Size': 3}, 'application/x-database-table-row')
+        serialized = self.serialize(entry)
+        self.assertTrue(serialized.startswith('<FieldValues><field_0>a&lt;b</field_0><field_1>3</field_1>'))
+
+    def test_field_subclass(self):
+        entry = MappingEntry({'Name': 'plain'}, 'application/x-database-table-row')
+        entry['Code'] = UpperCaseField('code_key', 'Code', EntryField.TYPE_TEXT, 'loud')
+        serialized = self.serialize(entry)
+        self.assertIn('<field_0>plain</field_0>', serialized)
+        self.assertIn('>LOUD</', serialized)
+        self.assertNotIn('loud', serialized)
@@ -4,20 +4,33 @@ import unittest
 from nuix_nli_lib.data_types import JSONFileEntry
 from nuix_nli_lib.nli.nli_generator import NLIGenerator
 
+RESOURCES: Path = (Path(__file__).parent / 'resources').resolve()
+SIMPLE_STR: Path = RESOURCES / 'simple_str.json'
+SIMPLE_INT: Path = RESOURCES / 'simple_int.json'
+SIMPLE_FLOAT: Path = RESOURCES / 'simple_float.json'
+SIMPLE_BOOLEAN: Path = RESOURCES / 'simple_boolean.json'
+LIST_MIXED: Path = RESOURCES / 'list_mixed.json'
+OBJECT_MIXED: Path = RESOURCES / 'object_mixed.json'
+OBJECT_COMPLEX: Path = RESOURCES / 'object_complex.json'
+OUTPUT_PATH: Path = RESOURCES / 'output' / 'json'
+
 
 class NLITests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        OUTPUT_PATH.mkdir(parents=True, exist_ok=True)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.simple_str: Path = Path("./resources/simple_str.json")
-        self.simple_int: Path = Path("./resources/simple_int.json")
-        self.simple_float: Path = Path("./resources/simple_float.json")
-        self.simple_boolean: Path = Path("./resources/simple_boolean.json")
-        self.list_mixed: Path = Path("./resources/list_mixed.json")
-        self.object_mixed: Path = Path("./resources/object_mixed.json")
-        self.object_complex: Path = Path("./resources/object_complex.json")
-
-        self.output_path: Path = Path(r'C:\projects\proserv\nli\json')
-        self.output_path.mkdir(parents=True, exist_ok=True)
+        self.simple_str: Path = SIMPLE_STR
+        self.simple_int: Path = SIMPLE_INT
+        self.simple_float: Path = SIMPLE_FLOAT
+        self.simple_boolean: Path = SIMPLE_BOOLEAN
+        self.list_mixed: Path = LIST_MIXED
+        self.object_mixed: Path = OBJECT_MIXED
+        self.object_complex: Path = OBJECT_COMPLEX
+
+        self.output_path: Path = OUTPUT_PATH
 
     def test_simple_str(self):
         entry = JSONFileEntry(str(self.simple_str))
@@ -1,10 +1,22 @@
 from pathlib import Path
 import unittest
+import zipfile
 from datetime import datetime
+from functools import cached_property
 
 from nuix_nli_lib.data_types import CSVEntry, CSVRowEntry
+from nuix_nli_lib.edrm import MappingEntry
 from nuix_nli_lib.nli.nli_generator import NLIGenerator
 
+RESOURCES: Path = (Path(__file__).parent / 'resources').resolve()
+ENVARS: str = str(RESOURCES / 'envars.csv')
+PSLIST: str = str(RESOURCES / 'windows.pslist.PsList.csv')
+MINPS: str = str(RESOURCES / 'windows.pslist.MinPsList.csv')
+MEMORY: str = str(RESOURCES / 'example.ps1')
+FOLDER: str = str(RESOURCES / 'source')
+CC_MEDIUM: str = str(RESOURCES / 'CC.Medium.csv')
+OUTPUT_PATH: Path = RESOURCES / 'output'
+
 
 class EnvEntry(CSVRowEntry):
     def __init__(self, parent_csv: CSVEntry, row_index: int):
@@ -13,11 +25,21 @@ class EnvEntry(CSVRowEntry):
     def get_name(self) -> str:
         return f'({self['PID'].value}) {self['Process'].value} [{self['Variable'].value}]'
 
-    @property
+    @cached_property
     def text(self) -> str:
         return f'{self['Variable'].value} = {self["Value"]}'
 
 
+def parse_short_date(value: str) -> datetime:
+    """
+    Parse a mm/dd/yy date, as datetime.strptime(value, '%m/%d/%y') would, without interpreting the format string for
+    every row.  Two-digit years are pivoted the way strptime does it: 69-99 are 19xx and 00-68 are 20xx.
+    """
+    month, day, year = value.split('/')
+    year = int(year)
+    return datetime(year + (1900 if year >= 69 else 2000), int(month), int(day))
+
+
 class CCEntry(CSVRowEntry):
     def __init__(self, parent_csv: CSVEntry, row_index: int):
         super().__init__(parent_csv, row_index)
@@ -29,7 +51,7 @@ class CCEntry(CSVRowEntry):
     def get_name(self) -> str:
         return f'({self['Complaint ID'].value}) {self['Company'].value}'
 
-    @property
+    @cached_property
     def text(self) -> str:
         return self['Consumer complaint narrative'].value
 
@@ -39,13 +61,13 @@ class CCEntry(CSVRowEntry):
 
     @property
     def itemdate(self) -> datetime:
-        return datetime.strptime(self[self.time_field].value, '%m/%d/%y')
+        return parse_short_date(self[self.time_field].value)
 
 
 class PsListSimple(CSVRowEntry):
     @property
     def itemdate(self):
-        return datetime.strptime(self['CreateTime'].value, '%Y-%m-%d %H:%M:%S.%f ')
+        return datetime.fromisoformat(self['CreateTime'].value.rstrip())
 
     def get_name(self):
         return f'({self['PID'].value}) {self['ImageFileName'].value}'
@@ -58,12 +80,12 @@ class PsListSimple(CSVRowEntry):
 class NLITests(unittest.TestCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.envars: str = str(Path(".", "resources", "envars.csv").absolute())
-        self.pslist: str = str(Path('.', 'resources', 'windows.pslist.PsList.csv').absolute())
-        self.minps: str = str(Path('.', 'resources', 'windows.pslist.MinPsList.csv').absolute())
-        self.memory: str = str(Path('.', 'resources', 'example.ps1').absolute())
-        self.folder: str = str(Path(".", "resources", "source").absolute())
-        self.output_path: Path = Path(".", "resources", "output").absolute()
+        self.envars: str = ENVARS
+        self.pslist: str = PSLIST
+        self.minps: str = MINPS
+        self.memory: str = MEMORY
+        self.folder: str = FOLDER
+        self.output_path: Path = OUTPUT_PATH
 
     def test_base_csv(self):
         entry = CSVEntry(self.envars, row_generator=EnvEntry)
@@ -72,7 +94,7 @@ class NLITests(unittest.TestCase):
         generator.save(self.output_path / 'csv_test.nli')
 
     def test_cc_csv(self):
-        entry = CSVEntry(str(Path('.', 'resources', 'CC.Medium.csv').absolute()), row_generator=CCEntry)
+        entry = CSVEntry(CC_MEDIUM, row_generator=CCEntry)
         generator = NLIGenerator()
         generator.add_entry(entry)
         generator.save(self.output_path / 'cc_test.nli')
@@ -85,6 +107,27 @@ class NLITests(unittest.TestCase):
         generator.add_entry(entry)
         generator.save(self.output_path / 'pslist_simple.nli')
 
+    def test_reused_load_file(self):
+        def read_load_file() -> bytes:
+            with zipfile.ZipFile(output_file) as nli_zip:
+                return nli_zip.read('._metadata/image_contents.xml')
+
+        output_file = self.output_path / 'reuse_test.nli'
+        entry = MappingEntry({'name': 'first', 'value': 1}, 'application/x-database-table-row')
+        generator = NLIGenerator(reuse_load_file=True)
+        generator.add_entry(entry)
+
+        generator.save(output_file)
+        first_load_file = read_load_file()
+        generator.save(output_file)
+        self.assertEqual(first_load_file, read_load_file())
+
+        entry.set_field_value('name', 'second')
+        generator.save(output_file)
+        second_load_file = read_load_file()
+        self.assertNotEqual(first_load_file, second_load_file)
+        self.assertIn(b'second', second_load_file)
+
     # def test_nli_csv(self):
     #     entry = CSVEntry(self.envars)
     #     builder = EDRMBuilder()
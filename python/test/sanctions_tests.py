@@ -1,16 +1,20 @@
-import os
 from pathlib import Path
 import unittest
 from datetime import datetime
+from functools import cached_property
 
 from nuix_nli_lib.data_types import CSVEntry, CSVRowEntry
 from nuix_nli_lib.edrm import FieldFactory, EntryField
 from nuix_nli_lib.nli.nli_generator import NLIGenerator
 
+RESOURCES: Path = (Path(__file__).parent / 'resources').resolve()
+SOURCE_DATA: str = str(RESOURCES / 'sanctions_list.csv')
+
 
 class SanctionsEntry(CSVRowEntry):
     FILE_MIME_TYPE = 'osint/sanctionlist'
     ROW_MIME_TYPE = 'osint/sanction'
+    TEXT_EXCLUDED_FIELDS = frozenset({'MIME Type', 'SHA-1', 'Item Date'})
 
     def __init__(self, parent_csv: CSVEntry, row_index: int):
         super().__init__(parent_csv, row_index)
@@ -20,10 +24,10 @@ class SanctionsEntry(CSVRowEntry):
     def get_name(self) -> str:
         return self["Name"].value
 
-    @property
+    @cached_property
     def text(self) -> str:
-        excluded_fields = ['MIME Type', 'SHA-1', 'Item Date']
-        return os.linesep.join([f'{i[0]} = {i[1].value}' for i in self if i[0] not in excluded_fields])
+        excluded_fields = SanctionsEntry.TEXT_EXCLUDED_FIELDS
+        return '\n'.join(f'{name} = {field.value}' for name, field in self if name not in excluded_fields)
 
     @property
     def time_field(self) -> str:
@@ -31,14 +35,14 @@ class SanctionsEntry(CSVRowEntry):
 
     @property
     def itemdate(self) -> datetime:
-        return datetime.strptime(self[self.time_field].value, '%Y-%m-%d')
+        return datetime.fromisoformat(self[self.time_field].value)
 
 
 class SanctionsTests(unittest.TestCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.source_data: str = r'./resources/sanctions_list.csv'
-        self.output_path: Path = Path(r'./resources')
+        self.source_data: str = SOURCE_DATA
+        self.output_path: Path = RESOURCES
 
     def test_base_csv(self):
         entry = CSVEntry(self.source_data, mimetype= SanctionsEntry.FILE_MIME_TYPE, row_generator=SanctionsEntry)
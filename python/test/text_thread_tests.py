@@ -2,11 +2,15 @@ import os
 from pathlib import Path
 import unittest
 from datetime import datetime
+from functools import cached_property
 
 from nuix_nli_lib.data_types import CSVEntry, CSVRowEntry
 from nuix_nli_lib.edrm import FieldFactory, EntryField
 from nuix_nli_lib.nli.nli_generator import NLIGenerator
 
+RESOURCES: Path = (Path(__file__).parent / 'resources').resolve()
+SOURCE_DATA: str = str(RESOURCES / 'text_thread.csv')
+
 
 class TextEntry(CSVRowEntry):
     FILE_MIME_TYPE = 'application/x-chat-conversation'
@@ -21,7 +25,7 @@ class TextEntry(CSVRowEntry):
     def get_name(self) -> str:
         return f'({self["Date Sent"].value}) {self["From"].value}'
 
-    @property
+    @cached_property
     def text(self) -> str:
         return self["Message"].value
 
@@ -31,14 +35,14 @@ class TextEntry(CSVRowEntry):
 
     @property
     def itemdate(self) -> datetime:
-        return datetime.strptime(self[self.time_field].value, '%Y-%m-%d %H:%M:%S')
+        return datetime.fromisoformat(self[self.time_field].value)
 
 
 class SanctionsTests(unittest.TestCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.source_data: str = r'./resources/text_thread.csv'
-        self.output_path: Path = Path(r'./resources')
+        self.source_data: str = SOURCE_DATA
+        self.output_path: Path = RESOURCES
 
     def test_base_csv(self):
         entry = CSVEntry(self.source_data, mimetype=TextEntry.FILE_MIME_TYPE, row_generator=TextEntry)